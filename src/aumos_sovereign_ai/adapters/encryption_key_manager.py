@@ -10,6 +10,7 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+from aumos_common.auth import TenantContext
 from aumos_common.observability import get_logger
 
 logger = get_logger(__name__)
@@ -51,13 +52,13 @@ class SovereignKeyManager:
         self._usage_log: list[dict[str, Any]] = []
         self._escrow_registry: dict[str, dict[str, Any]] = {}
 
-    def _compute_key_fingerprint(self, key_material: str | bytes) -> str:
+    def _compute_key_fingerprint(self, key_material: str | bytes | bytearray | memoryview) -> str:
         """Derive a SHA-256 fingerprint from key material for audit purposes.
 
         The fingerprint allows audit correlation without exposing key material.
 
         Args:
-            key_material: Raw key bytes or PEM-encoded string.
+            key_material: Raw key bytes (any bytes-like buffer) or PEM-encoded string.
 
         Returns:
             Hex-encoded SHA-256 fingerprint (64 characters).
@@ -68,7 +69,7 @@ class SovereignKeyManager:
 
     def _validate_key_format(
         self,
-        key_material: str | bytes,
+        key_material: str | bytes | bytearray | memoryview,
         algorithm: str,
     ) -> dict[str, Any]:
         """Validate key material format and algorithm compatibility.
@@ -90,7 +91,7 @@ class SovereignKeyManager:
             )
 
         key_bytes = key_material.encode() if isinstance(key_material, str) else key_material
-        key_length_bits = len(key_bytes) * 8
+        key_length_bits = memoryview(key_bytes).nbytes * 8
 
         validation: dict[str, Any] = {
             "is_valid": True,
@@ -114,7 +115,7 @@ class SovereignKeyManager:
 
     async def import_key(
         self,
-        key_material: str | bytes,
+        key_material: str | bytes | bytearray | memoryview,
         algorithm: str,
         key_alias: str,
         tenant_id: str,
@@ -129,7 +130,8 @@ class SovereignKeyManager:
         and only the opaque key ID is retained locally.
 
         Args:
-            key_material: Raw key material or PEM-encoded key.
+            key_material: Raw key material or PEM-encoded key. Bytes-like
+                buffers are hashed and measured in place without copying.
             algorithm: Key algorithm (AES-256, RSA-4096, etc.).
             key_alias: Human-readable key alias for management operations.
             tenant_id: Owning tenant UUID string.
@@ -201,6 +203,40 @@ class SovereignKeyManager:
         )
         return {k: v for k, v in key_record.items() if k != "key_material"}
 
+    async def import_key_bytes(
+        self,
+        key_id: str,
+        algorithm: str,
+        key_material: bytearray | memoryview,
+        jurisdiction: str,
+        tenant: TenantContext,
+    ) -> dict[str, Any]:
+        """Import raw customer key bytes (BYOK) without a base64 round-trip.
+
+        The buffer is validated and fingerprinted in place; no reference to
+        it is retained, so the caller may wipe it once this returns.
+
+        Args:
+            key_id: Customer-assigned key identifier, stored as the key alias.
+            algorithm: Key algorithm (AES-256, RSA-4096, etc.).
+            key_material: Raw key bytes in a writable buffer.
+            jurisdiction: Jurisdiction context for compliance labelling.
+            tenant: Owning tenant context.
+
+        Returns:
+            Key record dict with key_id, fingerprint, and lifecycle metadata.
+
+        Raises:
+            ValueError: If key algorithm is unsupported or key validation fails.
+        """
+        return await self.import_key(
+            key_material=key_material,
+            algorithm=algorithm,
+            key_alias=key_id,
+            tenant_id=str(tenant.tenant_id),
+            jurisdiction=jurisdiction,
+        )
+
     async def schedule_rotation(
         self,
         key_id: str,
@@ -250,7 +286,7 @@ class SovereignKeyManager:
     async def rotate_key(
         self,
         old_key_id: str,
-        new_key_material: str | bytes,
+        new_key_material: str | bytes | bytearray | memoryview,
         algorithm: str,
         tenant_id: str,
     ) -> dict[str, Any]:
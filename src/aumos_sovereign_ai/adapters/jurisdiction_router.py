@@ -31,6 +31,11 @@ JURISDICTION_HEADERS: list[str] = [
     "CF-IPCountry",
 ]
 
+# Lower-cased header names paired with their canonical spelling, in priority order
+_JURISDICTION_HEADERS_LOWER: tuple[tuple[str, str], ...] = tuple(
+    (name.lower(), name) for name in JURISDICTION_HEADERS
+)
+
 # Default fallback jurisdiction when detection is inconclusive
 DEFAULT_JURISDICTION = "US"
 
@@ -100,9 +105,11 @@ class JurisdictionRouter:
         Returns:
             Jurisdiction code from headers, or None if not present.
         """
+        if not headers:
+            return None
         headers_lower = {k.lower(): v for k, v in headers.items()}
-        for header_name in JURISDICTION_HEADERS:
-            value = headers_lower.get(header_name.lower())
+        for header_key, header_name in _JURISDICTION_HEADERS_LOWER:
+            value = headers_lower.get(header_key)
             if value:
                 jurisdiction = value.upper().strip()
                 logger.debug(
@@ -136,7 +143,7 @@ class JurisdictionRouter:
                 return value.upper().strip()
         return None
 
-    async def detect_request_origin(
+    def detect_request_origin(
         self,
         client_ip: str | None = None,
         headers: dict[str, str] | None = None,
@@ -145,6 +152,8 @@ class JurisdictionRouter:
         """Detect the request origin jurisdiction using layered detection strategies.
 
         Priority order: JWT claims > HTTP headers > IP geolocation > default.
+        Detection only inspects in-memory request data, so this is synchronous
+        and callers avoid a coroutine round-trip on every routed request.
 
         Args:
             client_ip: Optional client IP address.
@@ -14,7 +14,11 @@ Events published:
   - sovereign.model.approved — sovereign model approved for jurisdiction
 """
 
+import asyncio
 import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
 
 from aumos_common.events import EventPublisher, Topics
 from aumos_common.observability import get_logger
@@ -33,12 +37,19 @@ class SovereignEventPublisher:
     """Publisher for aumos-sovereign-ai domain events.
 
     Wraps EventPublisher with typed methods for each event type
-    produced by this service.
+    produced by this service. Entity identifier arguments accept either a
+    UUID or its string form; strings are placed in the payload unchanged, so
+    callers holding an ID string need not parse it first.
+
+    Use ``batch()`` when one operation emits several events, so they are
+    sent together instead of one publish call at a time.
 
     Args:
         publisher: The underlying EventPublisher from aumos-common.
     """
 
+    __slots__ = ("_pending", "_publisher")
+
     def __init__(self, publisher: EventPublisher) -> None:
         """Initialize with the shared event publisher.
 
@@ -46,6 +57,71 @@ class SovereignEventPublisher:
             publisher: Configured EventPublisher instance.
         """
         self._publisher = publisher
+        self._pending: list[tuple[str, dict[str, Any], str, dict[str, object]]] | None = None
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator["SovereignEventPublisher"]:
+        """Buffer events published inside the block and send them on exit.
+
+        Yields a publisher with the same typed methods whose events are
+        collected instead of sent. When the block exits normally all buffered
+        events are sent concurrently, and each event's "Published" log line is
+        written only after its own send has succeeded. If the block raises, the
+        events are dropped so none are emitted for a failed operation. The
+        receiver itself is not switched into buffering mode, so other callers
+        are unaffected.
+
+        Yields:
+            A buffering SovereignEventPublisher sharing this publisher's client.
+
+        Raises:
+            Exception: The send error when exactly one buffered event failed
+                to publish. Events that were delivered are still logged.
+            ExceptionGroup: All send errors when several events failed.
+        """
+        buffered = SovereignEventPublisher(self._publisher)
+        buffered._pending = []
+        yield buffered
+        pending, buffered._pending = buffered._pending, None
+        if not pending:
+            return
+        results = await asyncio.gather(
+            *(self._publisher.publish(topic, event) for topic, event, _, _ in pending),
+            return_exceptions=True,
+        )
+        failures: list[Exception] = []
+        for (_, _, message, log_fields), result in zip(pending, results, strict=True):
+            if isinstance(result, Exception):
+                failures.append(result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                logger.info(message, **log_fields)
+        if failures:
+            logger.error(
+                "Failed to flush batched events",
+                event_count=len(pending),
+                failed=len(failures),
+            )
+            if len(failures) == 1:
+                raise failures[0]
+            raise ExceptionGroup("Failed to flush batched events", failures)
+        logger.info("Flushed batched events", event_count=len(pending))
+
+    async def _send(self, topic: str, event: dict[str, Any], message: str, **log_fields: object) -> None:
+        """Publish an event and log it, or buffer both when inside a ``batch()`` block.
+
+        Args:
+            topic: Kafka topic name.
+            event: Event payload.
+            message: Log message recorded once the event has been published.
+            log_fields: Structured fields for the log record.
+        """
+        if self._pending is not None:
+            self._pending.append((topic, event, message, log_fields))
+            return
+        await self._publisher.publish(topic, event)
+        logger.info(message, **log_fields)
 
     async def publish_residency_violation(
         self,
@@ -54,6 +130,7 @@ class SovereignEventPublisher:
         data_region: str,
         action: str,
         correlation_id: str,
+        data_classification: str | None = None,
     ) -> None:
         """Publish a ResidencyViolation event to Kafka.
 
@@ -63,6 +140,7 @@ class SovereignEventPublisher:
             data_region: The region where data was found.
             action: The enforcement action taken.
             correlation_id: Request correlation ID for tracing.
+            data_classification: Optional classification of the affected data.
         """
         event = {
             "event_type": "residency.violation",
@@ -72,18 +150,23 @@ class SovereignEventPublisher:
             "action": action,
             "correlation_id": correlation_id,
         }
-        await self._publisher.publish(Topics.SOVEREIGN_RESIDENCY if hasattr(Topics, "SOVEREIGN_RESIDENCY") else SOVEREIGN_RESIDENCY_TOPIC, event)
-        logger.info(
+        if data_classification is not None:
+            event["data_classification"] = data_classification
+        await self._send(
+            Topics.SOVEREIGN_RESIDENCY if hasattr(Topics, "SOVEREIGN_RESIDENCY") else SOVEREIGN_RESIDENCY_TOPIC,
+            event,
             "Published ResidencyViolation event",
             tenant_id=str(tenant_id),
             jurisdiction=jurisdiction,
+            data_region=data_region,
             action=action,
+            correlation_id=correlation_id,
         )
 
     async def publish_residency_rule_created(
         self,
         tenant_id: uuid.UUID,
-        rule_id: uuid.UUID,
+        rule_id: str | uuid.UUID,
         jurisdiction: str,
         correlation_id: str,
     ) -> None:
@@ -102,8 +185,9 @@ class SovereignEventPublisher:
             "jurisdiction": jurisdiction,
             "correlation_id": correlation_id,
         }
-        await self._publisher.publish(SOVEREIGN_RESIDENCY_TOPIC, event)
-        logger.info(
+        await self._send(
+            SOVEREIGN_RESIDENCY_TOPIC,
+            event,
             "Published ResidencyRuleCreated event",
             tenant_id=str(tenant_id),
             rule_id=str(rule_id),
@@ -113,7 +197,7 @@ class SovereignEventPublisher:
     async def publish_deployment_initiated(
         self,
         tenant_id: uuid.UUID,
-        deployment_id: uuid.UUID,
+        deployment_id: str | uuid.UUID,
         region: str,
         jurisdiction: str,
         correlation_id: str,
@@ -135,8 +219,9 @@ class SovereignEventPublisher:
             "jurisdiction": jurisdiction,
             "correlation_id": correlation_id,
         }
-        await self._publisher.publish(SOVEREIGN_DEPLOYMENT_TOPIC, event)
-        logger.info(
+        await self._send(
+            SOVEREIGN_DEPLOYMENT_TOPIC,
+            event,
             "Published DeploymentInitiated event",
             tenant_id=str(tenant_id),
             deployment_id=str(deployment_id),
@@ -146,7 +231,7 @@ class SovereignEventPublisher:
     async def publish_deployment_active(
         self,
         tenant_id: uuid.UUID,
-        deployment_id: uuid.UUID,
+        deployment_id: str | uuid.UUID,
         region: str,
         endpoint_url: str,
         correlation_id: str,
@@ -168,8 +253,9 @@ class SovereignEventPublisher:
             "endpoint_url": endpoint_url,
             "correlation_id": correlation_id,
         }
-        await self._publisher.publish(SOVEREIGN_DEPLOYMENT_TOPIC, event)
-        logger.info(
+        await self._send(
+            SOVEREIGN_DEPLOYMENT_TOPIC,
+            event,
             "Published DeploymentActive event",
             tenant_id=str(tenant_id),
             deployment_id=str(deployment_id),
@@ -180,7 +266,7 @@ class SovereignEventPublisher:
         self,
         tenant_id: uuid.UUID,
         jurisdiction: str,
-        deployment_id: uuid.UUID,
+        deployment_id: str | uuid.UUID,
         model_id: str,
         correlation_id: str,
     ) -> None:
@@ -201,8 +287,9 @@ class SovereignEventPublisher:
             "model_id": model_id,
             "correlation_id": correlation_id,
         }
-        await self._publisher.publish(SOVEREIGN_ROUTING_TOPIC, event)
-        logger.info(
+        await self._send(
+            SOVEREIGN_ROUTING_TOPIC,
+            event,
             "Published RoutingDecision event",
             tenant_id=str(tenant_id),
             jurisdiction=jurisdiction,
@@ -212,7 +299,7 @@ class SovereignEventPublisher:
     async def publish_compliance_mapping_created(
         self,
         tenant_id: uuid.UUID,
-        mapping_id: uuid.UUID,
+        mapping_id: str | uuid.UUID,
         jurisdiction: str,
         regulation_name: str,
         correlation_id: str,
@@ -234,8 +321,9 @@ class SovereignEventPublisher:
             "regulation_name": regulation_name,
             "correlation_id": correlation_id,
         }
-        await self._publisher.publish(SOVEREIGN_COMPLIANCE_TOPIC, event)
-        logger.info(
+        await self._send(
+            SOVEREIGN_COMPLIANCE_TOPIC,
+            event,
             "Published ComplianceMappingCreated event",
             tenant_id=str(tenant_id),
             mapping_id=str(mapping_id),
@@ -245,7 +333,7 @@ class SovereignEventPublisher:
     async def publish_sovereign_model_registered(
         self,
         tenant_id: uuid.UUID,
-        model_reg_id: uuid.UUID,
+        model_reg_id: str | uuid.UUID,
         model_id: str,
         jurisdiction: str,
         correlation_id: str,
@@ -267,8 +355,9 @@ class SovereignEventPublisher:
             "jurisdiction": jurisdiction,
             "correlation_id": correlation_id,
         }
-        await self._publisher.publish(SOVEREIGN_REGISTRY_TOPIC, event)
-        logger.info(
+        await self._send(
+            SOVEREIGN_REGISTRY_TOPIC,
+            event,
             "Published SovereignModelRegistered event",
             tenant_id=str(tenant_id),
             model_reg_id=str(model_reg_id),
@@ -279,7 +368,7 @@ class SovereignEventPublisher:
     async def publish_sovereign_model_approved(
         self,
         tenant_id: uuid.UUID,
-        model_reg_id: uuid.UUID,
+        model_reg_id: str | uuid.UUID,
         model_id: str,
         jurisdiction: str,
         approved_by: str,
@@ -304,8 +393,9 @@ class SovereignEventPublisher:
             "approved_by": approved_by,
             "correlation_id": correlation_id,
         }
-        await self._publisher.publish(SOVEREIGN_REGISTRY_TOPIC, event)
-        logger.info(
+        await self._send(
+            SOVEREIGN_REGISTRY_TOPIC,
+            event,
             "Published SovereignModelApproved event",
             tenant_id=str(tenant_id),
             model_reg_id=str(model_reg_id),
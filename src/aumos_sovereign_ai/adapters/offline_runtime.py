@@ -332,13 +332,13 @@ class OfflineRuntime:
     async def list_cached_models(self) -> list[dict[str, Any]]:
         """List all models currently loaded in the offline runtime.
 
+        Served from the in-memory load registry, so no filesystem scan or
+        stat call happens per listing.
+
         Returns:
             List of loaded model records with metadata and inference counts.
         """
-        return [
-            {k: v for k, v in record.items()}
-            for record in self._loaded_models.values()
-        ]
+        return [dict(record) for record in self._loaded_models.values()]
 
     async def collect_offline_metrics(
         self,
@@ -6,6 +6,7 @@ regional health monitoring, failover, region-specific configuration, and
 deployment coordination.
 """
 
+import asyncio
 import uuid
 from datetime import datetime, timezone
 from typing import Any
@@ -292,6 +293,10 @@ class RegionalDeployer:
     ) -> list[dict[str, Any]]:
         """Deploy to multiple regions simultaneously and collect results.
 
+        A failure in one region never discards the others' results: regions
+        without a registered cluster are reported as ``skipped`` and any other
+        error as ``failed``, each with its error message.
+
         Args:
             model_id: Model to deploy across regions.
             model_version: Model version.
@@ -301,38 +306,52 @@ class RegionalDeployer:
             tenant: Tenant context.
 
         Returns:
-            List of deployment records, one per region.
+            List of deployment records, one per region, in target_regions order.
         """
-        results: list[dict[str, Any]] = []
-        for region in target_regions:
-            jurisdiction = jurisdiction_map.get(region, "GLOBAL")
-            try:
-                record = await self.deploy_to_region(
+        # Regions are independent; fan out and keep results in target_regions order.
+        outcomes = await asyncio.gather(
+            *(
+                self.deploy_to_region(
                     model_id=model_id,
                     model_version=model_version,
                     region=region,
-                    jurisdiction=jurisdiction,
+                    jurisdiction=jurisdiction_map.get(region, "GLOBAL"),
                     resource_config=resource_config,
                     tenant=tenant,
                 )
-                results.append(record)
-            except ValueError as exc:
+                for region in target_regions
+            ),
+            return_exceptions=True,
+        )
+
+        results: list[dict[str, Any]] = []
+        for region, outcome in zip(target_regions, outcomes, strict=True):
+            if isinstance(outcome, ValueError):
                 logger.warning(
                     "Skipping region deployment — no cluster registered",
                     region=region,
-                    error=str(exc),
+                    error=str(outcome),
+                )
+                results.append({"region": region, "status": "skipped", "error": str(outcome)})
+            elif isinstance(outcome, Exception):
+                logger.error(
+                    "Regional deployment failed",
+                    region=region,
+                    model_id=model_id,
+                    error=str(outcome),
                 )
-                results.append({
-                    "region": region,
-                    "status": "skipped",
-                    "error": str(exc),
-                })
+                results.append({"region": region, "status": "failed", "error": str(outcome)})
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results.append(outcome)
 
         logger.info(
             "Multi-region deployment complete",
             model_id=model_id,
             total_regions=len(target_regions),
             successful=sum(1 for r in results if r.get("status") == "deploying"),
+            failed=sum(1 for r in results if r.get("status") == "failed"),
         )
         return results
 
@@ -10,9 +10,10 @@ Implements only the methods that differ from BaseRepository defaults.
 """
 
 import uuid
+from collections.abc import Iterable
 from datetime import UTC, datetime
 
-from sqlalchemy import select, update
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from aumos_common.auth import TenantContext
@@ -111,6 +112,69 @@ class ResidencyRuleRepository(BaseRepository, IResidencyRuleRepository):
         )
         return list(result.scalars().all())
 
+    async def list_active_by_jurisdiction_and_classification(
+        self, jurisdiction: str, data_classification: str, tenant: TenantContext
+    ) -> list[ResidencyRule]:
+        """List active rules applying to a jurisdiction and data classification.
+
+        Rules scoped to ``"all"`` classifications are included alongside those
+        matching ``data_classification``. Filtering and ordering run in SQL,
+        backed by the ``(tenant_id, jurisdiction, is_active, priority)`` index.
+
+        Args:
+            jurisdiction: Jurisdiction identifier to filter by.
+            data_classification: Data classification tier to match.
+            tenant: Tenant context for RLS isolation.
+
+        Returns:
+            Applicable active ResidencyRule records ordered by priority.
+        """
+        result = await self.session.execute(
+            select(ResidencyRule).where(
+                ResidencyRule.jurisdiction == jurisdiction,
+                ResidencyRule.tenant_id == tenant.tenant_id,
+                ResidencyRule.is_active.is_(True),
+                ResidencyRule.data_classification.in_(("all", data_classification)),
+            ).order_by(ResidencyRule.priority.asc())
+        )
+        return list(result.scalars().all())
+
+    async def count_and_list_active(
+        self, jurisdiction: str, tenant: TenantContext
+    ) -> tuple[int, list[ResidencyRule]]:
+        """Count all rules for a jurisdiction and load only the active ones.
+
+        The total is carried on each active row as a scalar subquery, so the
+        common case is a single round-trip; a bare count is issued only when
+        the jurisdiction has no active rules.
+
+        Args:
+            jurisdiction: Jurisdiction identifier to filter by.
+            tenant: Tenant context for RLS isolation.
+
+        Returns:
+            Tuple of (total rule count, active rules ordered by priority).
+        """
+        scope = (
+            ResidencyRule.jurisdiction == jurisdiction,
+            ResidencyRule.tenant_id == tenant.tenant_id,
+        )
+        total_rules = select(func.count()).select_from(ResidencyRule).where(*scope).scalar_subquery()
+        result = await self.session.execute(
+            select(ResidencyRule, total_rules).where(
+                *scope,
+                ResidencyRule.is_active.is_(True),
+            ).order_by(ResidencyRule.priority.asc())
+        )
+        rows = result.all()
+        if rows:
+            return rows[0][1], [row[0] for row in rows]
+
+        total = await self.session.scalar(
+            select(func.count()).select_from(ResidencyRule).where(*scope)
+        )
+        return total or 0, []
+
     async def create(
         self,
         jurisdiction: str,
@@ -218,6 +282,30 @@ class RegionalDeploymentRepository(BaseRepository, IRegionalDeploymentRepository
         )
         return result.scalar_one_or_none()
 
+    async def list_by_ids(
+        self, deployment_ids: Iterable[uuid.UUID], tenant: TenantContext
+    ) -> dict[uuid.UUID, RegionalDeployment]:
+        """Retrieve several regional deployments in a single query.
+
+        Args:
+            deployment_ids: UUIDs of the deployments to load.
+            tenant: Tenant context for RLS isolation.
+
+        Returns:
+            Mapping of deployment ID to RegionalDeployment. IDs that do not
+            exist for the tenant are absent from the mapping.
+        """
+        ids = list(deployment_ids)
+        if not ids:
+            return {}
+        result = await self.session.execute(
+            select(RegionalDeployment).where(
+                RegionalDeployment.id.in_(ids),
+                RegionalDeployment.tenant_id == tenant.tenant_id,
+            )
+        )
+        return {deployment.id: deployment for deployment in result.scalars().all()}
+
     async def list_all(
         self, tenant: TenantContext
     ) -> list[RegionalDeployment]:
@@ -422,6 +510,30 @@ class RoutingPolicyRepository(BaseRepository, IRoutingPolicyRepository):
         )
         return list(result.scalars().all())
 
+    async def list_active_by_jurisdiction(
+        self, jurisdiction: str, tenant: TenantContext
+    ) -> list[RoutingPolicy]:
+        """List active routing policies for a jurisdiction in priority order.
+
+        Filtering and ordering run in SQL, backed by the
+        ``(tenant_id, source_jurisdiction, is_active, priority)`` index.
+
+        Args:
+            jurisdiction: Source jurisdiction to filter by.
+            tenant: Tenant context for RLS isolation.
+
+        Returns:
+            Active RoutingPolicy records ordered by priority.
+        """
+        result = await self.session.execute(
+            select(RoutingPolicy).where(
+                RoutingPolicy.source_jurisdiction == jurisdiction,
+                RoutingPolicy.tenant_id == tenant.tenant_id,
+                RoutingPolicy.is_active.is_(True),
+            ).order_by(RoutingPolicy.priority.asc())
+        )
+        return list(result.scalars().all())
+
     async def list_active(
         self, tenant: TenantContext
     ) -> list[RoutingPolicy]:
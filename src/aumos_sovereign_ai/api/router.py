@@ -14,8 +14,12 @@ Endpoints:
   GET    /sovereign/registry/models         — List sovereign models
 """
 
+from collections.abc import Callable
+
 from fastapi import APIRouter, Depends
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from aumos_common.auth import TenantContext, get_current_user
 from aumos_common.database import get_db_session
@@ -43,6 +47,8 @@ from aumos_sovereign_ai.api.schemas import (
     SovereignModelRegisterRequest,
     SovereignModelResponse,
 )
+from aumos_sovereign_ai.core.cache import AsyncTTLCache, CacheKey, CommitHook
+from aumos_sovereign_ai.core.models import RegionalDeploymentSnapshot, ResidencyRuleSnapshot, RoutingPolicySnapshot
 from aumos_sovereign_ai.core.services import (
     ComplianceMapperService,
     GeopatriationService,
@@ -53,6 +59,46 @@ from aumos_sovereign_ai.core.services import (
 
 router = APIRouter(tags=["sovereign-ai"])
 
+# Process-wide read caches for the per-request residency and routing hot paths.
+# Services are built per request, so the caches live here. They hold immutable
+# snapshots, never session-bound ORM instances. TTLs bound staleness across
+# replicas; writes made through this process invalidate once their transaction
+# commits (see _after_commit).
+_residency_rule_cache: AsyncTTLCache[CacheKey, tuple[ResidencyRuleSnapshot, ...]] = AsyncTTLCache(
+    maxsize=4096, ttl_seconds=10
+)
+_residency_status_cache: AsyncTTLCache[CacheKey, tuple[int, tuple[ResidencyRuleSnapshot, ...]]] = AsyncTTLCache(
+    maxsize=4096, ttl_seconds=10
+)
+_routing_policy_cache: AsyncTTLCache[CacheKey, tuple[RoutingPolicySnapshot, ...]] = AsyncTTLCache(
+    maxsize=4096, ttl_seconds=10
+)
+_deployment_cache: AsyncTTLCache[CacheKey, RegionalDeploymentSnapshot] = AsyncTTLCache(maxsize=4096, ttl_seconds=5)
+
+
+def _after_commit(session: AsyncSession) -> CommitHook:
+    """Build a hook that runs cache invalidation once the session commits.
+
+    Repositories only flush; get_db_session commits after the handler returns.
+    Invalidating before that lets a concurrent request reload and cache the
+    pre-commit rows. A rolled-back transaction changed nothing, so the
+    callbacks are simply dropped.
+
+    Args:
+        session: The current async database session.
+
+    Returns:
+        A CommitHook bound to the session's next commit.
+    """
+
+    def schedule(callback: Callable[[], object]) -> None:
+        def on_commit(_session: Session) -> None:
+            callback()
+
+        event.listen(session.sync_session, "after_commit", on_commit, once=True)
+
+    return schedule
+
 
 def _get_publisher(session: AsyncSession) -> SovereignEventPublisher:
     """Build a SovereignEventPublisher from the session context.
@@ -104,6 +150,9 @@ async def enforce_data_residency(
     service = GeopatriationService(
         residency_repo=ResidencyRuleRepository(session),
         publisher=publisher,
+        rule_cache=_residency_rule_cache,
+        status_cache=_residency_status_cache,
+        after_commit=_after_commit(session),
     )
     result = await service.enforce_residency(
         jurisdiction=request.jurisdiction,
@@ -139,6 +188,9 @@ async def get_residency_status(
     service = GeopatriationService(
         residency_repo=ResidencyRuleRepository(session),
         publisher=publisher,
+        rule_cache=_residency_rule_cache,
+        status_cache=_residency_status_cache,
+        after_commit=_after_commit(session),
     )
     result = await service.get_residency_status(
         jurisdiction=jurisdiction,
@@ -173,6 +225,9 @@ async def create_residency_rule(
     service = GeopatriationService(
         residency_repo=ResidencyRuleRepository(session),
         publisher=publisher,
+        rule_cache=_residency_rule_cache,
+        status_cache=_residency_status_cache,
+        after_commit=_after_commit(session),
     )
     rule = await service.create_residency_rule(
         jurisdiction=request.jurisdiction,
@@ -231,6 +286,8 @@ async def deploy_to_region(
     service = RegionalDeployerService(
         deployment_repo=RegionalDeploymentRepository(session),
         publisher=publisher,
+        deployment_cache=_deployment_cache,
+        after_commit=_after_commit(session),
     )
     deployment = await service.deploy_to_region(
         region=request.region,
@@ -279,6 +336,8 @@ async def list_regions(
     service = RegionalDeployerService(
         deployment_repo=RegionalDeploymentRepository(session),
         publisher=publisher,
+        deployment_cache=_deployment_cache,
+        after_commit=_after_commit(session),
     )
     deployments = await service.list_regions(tenant)
     return [
@@ -335,6 +394,9 @@ async def route_by_jurisdiction(
         routing_repo=RoutingPolicyRepository(session),
         deployment_repo=RegionalDeploymentRepository(session),
         publisher=publisher,
+        policy_cache=_routing_policy_cache,
+        deployment_cache=_deployment_cache,
+        after_commit=_after_commit(session),
     )
     result = await service.route_by_jurisdiction(
         jurisdiction=request.jurisdiction,
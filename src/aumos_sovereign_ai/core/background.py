@@ -0,0 +1,73 @@
+"""Fire-and-forget scheduling for side effects that do not shape a response.
+
+Domain event publishing after an audit, a transfer check or a model download
+does not change what the caller gets back, so services hand those coroutines
+to ``run_in_background`` and return as soon as the primary result is ready.
+
+The event loop only keeps weak references to tasks, so every scheduled task is
+held in a module-level set until it finishes. Services are constructed per
+request, which is why the set lives here rather than on a service instance.
+Failures are logged and never propagate into the request that scheduled them.
+"""
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+
+from aumos_common.observability import get_logger
+
+logger = get_logger(__name__)
+
+_background_tasks: set[asyncio.Task[Any]] = set()
+
+
+def _on_task_done(task: asyncio.Task[Any]) -> None:
+    """Release a finished task and log its failure, if any.
+
+    Args:
+        task: The completed background task.
+    """
+    _background_tasks.discard(task)
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.error(
+            "Background task failed",
+            task_name=task.get_name(),
+            error=str(exc),
+            exc_info=exc,
+        )
+
+
+def run_in_background(coro: Coroutine[Any, Any, Any], *, name: str | None = None) -> asyncio.Task[Any]:
+    """Schedule a coroutine without awaiting it.
+
+    Args:
+        coro: Coroutine to run, typically a publisher call.
+        name: Optional task name used in failure logs.
+
+    Returns:
+        The scheduled task. Callers normally ignore it.
+    """
+    task = asyncio.get_running_loop().create_task(coro, name=name)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_task_done)
+    return task
+
+
+async def drain_background_tasks(timeout: float | None = None) -> None:
+    """Wait for all outstanding background tasks, e.g. during shutdown.
+
+    Args:
+        timeout: Maximum seconds to wait. Tasks still running afterwards are
+            left to be cancelled with the event loop.
+    """
+    if not _background_tasks:
+        return
+    pending = list(_background_tasks)
+    logger.info("Draining background tasks", pending=len(pending))
+    await asyncio.wait(pending, timeout=timeout)
+
+
+__all__ = ["drain_background_tasks", "run_in_background"]
@@ -0,0 +1,208 @@
+"""In-process TTL cache for read-mostly service lookups.
+
+Registry entries, certifications and routing policies change on a scale of
+minutes to days, while the endpoints that read them are hit on every request.
+``AsyncTTLCache`` keeps recent results in memory so repeat reads skip the
+database round-trip. Concurrent misses on the same key are collapsed behind a
+per-key ``asyncio.Lock`` so only one loader call is in flight per key.
+
+The cache is process-local and must be invalidated explicitly by the service
+that owns the mutation path. Entries outlive the request and session that
+loaded them, so never cache ORM instances: they can expire or detach, and are
+mutable. Cache immutable snapshots (frozen dataclasses, tuples, plain values)
+built from the loaded rows instead.
+
+Mutations made inside a database transaction must invalidate only once that
+transaction has committed; otherwise a concurrent reader can reload the old
+rows in the gap and cache them for a full TTL. Services take a ``CommitHook``
+for this. Every invalidation also bumps a generation counter, so a load that
+was already in flight when the entries were dropped returns its result
+without caching it.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Key shape used by the service caches: a namespace string, the tenant ID, then lookup arguments.
+CacheKey = tuple[Hashable, ...]
+
+# Schedules a zero-argument callback to run once the caller's transaction commits.
+CommitHook = Callable[[Callable[[], object]], None]
+
+
+def run_immediately(callback: Callable[[], object]) -> None:
+    """CommitHook for callers with no pending transaction: run the callback now.
+
+    Args:
+        callback: Invalidation to perform.
+    """
+    callback()
+
+
+class _CacheEntry(Generic[V]):
+    """A cached value and the monotonic deadline after which it is stale."""
+
+    __slots__ = ("expires_at", "value")
+
+    def __init__(self, value: V, expires_at: float) -> None:
+        self.value = value
+        self.expires_at = expires_at
+
+
+class AsyncTTLCache(Generic[K, V]):
+    """Bounded LRU cache with per-entry time-to-live for async loaders.
+
+    Args:
+        maxsize: Maximum number of entries kept before the least recently
+            used entry is evicted.
+        ttl_seconds: Lifetime of each entry in seconds.
+    """
+
+    __slots__ = ("_entries", "_generation", "_locks", "_maxsize", "_ttl")
+
+    def __init__(self, maxsize: int = 4096, ttl_seconds: float = 60.0) -> None:
+        """Initialize AsyncTTLCache.
+
+        Args:
+            maxsize: Maximum number of cached entries.
+            ttl_seconds: Lifetime of each entry in seconds.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self._maxsize = maxsize
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[K, _CacheEntry[V]] = OrderedDict()
+        self._locks: dict[K, asyncio.Lock] = {}
+        self._generation = 0
+
+    def __len__(self) -> int:
+        """Return the number of entries currently held, including stale ones."""
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every invalidation; pass it back to ``set`` to skip stale writes."""
+        return self._generation
+
+    def _fresh_entry(self, key: K) -> _CacheEntry[V] | None:
+        """Return the live entry for a key, dropping it if it has expired.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The entry, or None on a miss or an expired entry.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Return a fresh cached value or the default.
+
+        Args:
+            key: Cache key.
+            default: Value returned on a miss or an expired entry.
+
+        Returns:
+            The cached value, or ``default``.
+        """
+        entry = self._fresh_entry(key)
+        return default if entry is None else entry.value
+
+    def set(self, key: K, value: V, generation: int | None = None) -> None:
+        """Store a value, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+            generation: ``generation`` read before the value was loaded. When
+                an invalidation has happened since, the value may predate it
+                and is not stored.
+        """
+        if generation is not None and generation != self._generation:
+            return
+        self._entries[key] = _CacheEntry(value, time.monotonic() + self._ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K, default: V | None = None) -> V | None:
+        """Remove a single entry.
+
+        Args:
+            key: Cache key.
+            default: Value returned when the key is absent.
+
+        Returns:
+            The removed value, or ``default``.
+        """
+        self._generation += 1
+        entry = self._entries.pop(key, None)
+        return default if entry is None else entry.value
+
+    def invalidate(self, predicate: Callable[[K], bool]) -> int:
+        """Remove every entry whose key matches the predicate.
+
+        Args:
+            predicate: Called with each key; entries returning True are dropped.
+
+        Returns:
+            Number of entries removed.
+        """
+        self._generation += 1
+        stale = [key for key in self._entries if predicate(key)]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._generation += 1
+        self._entries.clear()
+
+    async def get_or_load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        """Return the cached value for a key, loading it on a miss.
+
+        Concurrent callers missing on the same key wait on a shared lock, so
+        the loader runs once and the others read its result. A result whose
+        load overlapped an invalidation is returned but not cached.
+
+        Args:
+            key: Cache key.
+            loader: Zero-argument coroutine factory producing the value.
+
+        Returns:
+            The cached or freshly loaded value.
+        """
+        entry = self._fresh_entry(key)
+        if entry is not None:
+            return entry.value
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                entry = self._fresh_entry(key)
+                if entry is not None:
+                    return entry.value
+                generation = self._generation
+                value = await loader()
+                self.set(key, value, generation)
+                return value
+        finally:
+            if not lock.locked() and self._locks.get(key) is lock:
+                del self._locks[key]
+
+
+__all__ = ["AsyncTTLCache", "CacheKey", "CommitHook", "run_immediately"]
@@ -9,6 +9,7 @@ Services depend on interfaces, not concrete implementations.
 """
 
 import uuid
+from collections.abc import Iterable
 from typing import Protocol, runtime_checkable
 
 from aumos_common.auth import TenantContext
@@ -41,6 +42,14 @@ class IResidencyRuleRepository(Protocol):
         self, tenant: TenantContext
     ) -> list[ResidencyRule]: ...
 
+    async def list_active_by_jurisdiction_and_classification(
+        self, jurisdiction: str, data_classification: str, tenant: TenantContext
+    ) -> list[ResidencyRule]: ...
+
+    async def count_and_list_active(
+        self, jurisdiction: str, tenant: TenantContext
+    ) -> tuple[int, list[ResidencyRule]]: ...
+
     async def create(
         self,
         jurisdiction: str,
@@ -70,6 +79,10 @@ class IRegionalDeploymentRepository(Protocol):
         self, deployment_id: uuid.UUID, tenant: TenantContext
     ) -> RegionalDeployment | None: ...
 
+    async def list_by_ids(
+        self, deployment_ids: Iterable[uuid.UUID], tenant: TenantContext
+    ) -> dict[uuid.UUID, RegionalDeployment]: ...
+
     async def list_all(
         self, tenant: TenantContext
     ) -> list[RegionalDeployment]: ...
@@ -122,6 +135,10 @@ class IRoutingPolicyRepository(Protocol):
         self, tenant: TenantContext
     ) -> list[RoutingPolicy]: ...
 
+    async def list_active_by_jurisdiction(
+        self, jurisdiction: str, tenant: TenantContext
+    ) -> list[RoutingPolicy]: ...
+
     async def create(
         self,
         name: str,
@@ -311,6 +328,15 @@ class IEncryptionKeyManager(Protocol):
         tenant: TenantContext,
     ) -> dict: ...
 
+    async def import_key_bytes(
+        self,
+        key_id: str,
+        algorithm: str,
+        key_material: bytearray | memoryview,
+        jurisdiction: str,
+        tenant: TenantContext,
+    ) -> dict: ...
+
     async def schedule_rotation(
         self,
         key_id: str,
@@ -442,7 +468,7 @@ class IRegionalDeployer(Protocol):
 class IJurisdictionRouter(Protocol):
     """Contract for multi-source jurisdiction detection and sovereign routing."""
 
-    async def detect_request_origin(
+    def detect_request_origin(
         self,
         *,
         jwt_claims: dict | None = None,
@@ -470,7 +496,7 @@ class IJurisdictionRouter(Protocol):
         model_id: str,
         selected_region: str,
         routing_method: str,
-        confidence: float,
+        confidence: str,
         tenant: TenantContext,
     ) -> None: ...
 
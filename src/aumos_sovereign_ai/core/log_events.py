@@ -0,0 +1,113 @@
+"""Integer event codes for high-volume service log lines.
+
+Routing, residency and inference logs fire on every request. Those call sites
+log a ``LogEvent`` member instead of a free-text message so the record carries
+a compact integer code. The human-readable message is attached only at sink
+time: ``install_log_event_renderer`` (called from ``main``) adds
+``render_log_event`` to the structlog processor chain ahead of the renderer.
+
+Low-volume events (rule creation, key rotation, ...) keep plain string
+messages.
+
+Per-request call sites also check ``is_info_enabled`` once per service and skip
+the ``info`` call entirely when INFO is filtered out, so the keyword arguments
+(``str(uuid)`` conversions, enum values) are never evaluated in that case.
+"""
+
+import enum
+import logging
+
+import structlog
+from structlog.typing import BindableLogger, EventDict, WrappedLogger
+
+
+class LogEvent(enum.IntEnum):
+    """Stable codes for per-request service log events."""
+
+    ROUTING_DECISION = 1001
+    JURISDICTION_ROUTING_STARTED = 1002
+    JURISDICTION_ROUTING_DECIDED = 1003
+    JURISDICTION_ROUTING_FALLBACK = 1004
+    RESIDENCY_ENFORCEMENT_STARTED = 1101
+    RESIDENCY_ENFORCEMENT_COMPLETE = 1102
+    TRANSFER_ENFORCEMENT_COMPLETE = 1201
+    OFFLINE_INFERENCE_COMPLETED = 1301
+
+
+LOG_EVENT_MESSAGES: dict[int, str] = {
+    LogEvent.ROUTING_DECISION: "Sovereign routing decision",
+    LogEvent.JURISDICTION_ROUTING_STARTED: "Routing request by jurisdiction",
+    LogEvent.JURISDICTION_ROUTING_DECIDED: "Routing decision made",
+    LogEvent.JURISDICTION_ROUTING_FALLBACK: "Using fallback deployment",
+    LogEvent.RESIDENCY_ENFORCEMENT_STARTED: "Enforcing data residency",
+    LogEvent.RESIDENCY_ENFORCEMENT_COMPLETE: "Residency enforcement complete",
+    LogEvent.TRANSFER_ENFORCEMENT_COMPLETE: "Cross-border transfer enforcement complete",
+    LogEvent.OFFLINE_INFERENCE_COMPLETED: "Offline inference completed",
+}
+
+
+def is_info_enabled(log: BindableLogger | logging.Logger) -> bool:
+    """Return whether INFO records from a logger would be emitted.
+
+    Supports structlog filtering bound loggers (``is_enabled_for``) and
+    stdlib-compatible loggers (``isEnabledFor``). Loggers exposing neither are
+    assumed to emit everything.
+
+    Args:
+        log: A structlog bound logger or a stdlib logger.
+
+    Returns:
+        False only when the logger reports INFO as filtered out.
+    """
+    check = getattr(log, "is_enabled_for", None) or getattr(log, "isEnabledFor", None)
+    if not callable(check):
+        return True
+    return bool(check(logging.INFO))
+
+
+def render_log_event(
+    logger: WrappedLogger,
+    method_name: str,
+    event_dict: EventDict,
+) -> EventDict:
+    """Structlog processor translating a ``LogEvent`` code into its message.
+
+    The integer is kept under ``event_code`` for filtering and the ``event``
+    key receives the human-readable message. Records logged with a plain
+    string pass through unchanged.
+
+    Args:
+        logger: Wrapped logger (unused).
+        method_name: Log method name (unused).
+        event_dict: Event dictionary being processed.
+
+    Returns:
+        The event dictionary, with the code expanded when applicable.
+    """
+    event = event_dict.get("event")
+    if isinstance(event, LogEvent):
+        event_dict["event_code"] = int(event)
+        event_dict["event"] = LOG_EVENT_MESSAGES[event]
+    return event_dict
+
+
+def install_log_event_renderer() -> None:
+    """Insert ``render_log_event`` into structlog's processor chain.
+
+    The processor goes directly ahead of the last processor, which is the
+    renderer in any standard chain. Calling this again is a no-op.
+    """
+    processors = list(structlog.get_config()["processors"])
+    if render_log_event in processors:
+        return
+    processors.insert(max(len(processors) - 1, 0), render_log_event)
+    structlog.configure(processors=processors)
+
+
+__all__ = [
+    "LOG_EVENT_MESSAGES",
+    "LogEvent",
+    "install_log_event_renderer",
+    "is_info_enabled",
+    "render_log_event",
+]
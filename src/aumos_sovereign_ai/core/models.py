@@ -7,11 +7,16 @@ All tenant-scoped tables extend AumOSModel which provides:
   - updated_at: datetime
 
 Table prefix: sov_
+
+Lightweight value objects returned by services (not persisted) live here too.
 """
 
 import enum
+import uuid
+from dataclasses import dataclass
+from functools import cached_property
 
-from sqlalchemy import Boolean, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Enum, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -74,6 +79,16 @@ class ResidencyRule(AumOSModel):
     """
 
     __tablename__ = "sov_residency_rules"
+    __table_args__ = (
+        # Serves the per-request active-rule lookup (filter and ORDER BY priority).
+        Index(
+            "ix_sov_residency_rules_tenant_jurisdiction_active_priority",
+            "tenant_id",
+            "jurisdiction",
+            "is_active",
+            "priority",
+        ),
+    )
 
     jurisdiction: Mapped[str] = mapped_column(
         String(10),
@@ -124,6 +139,22 @@ class ResidencyRule(AumOSModel):
         comment="Additional rule metadata (regulatory references, audit notes)",
     )
 
+    @cached_property
+    def allowed_region_set(self) -> frozenset[str]:
+        """Allowed regions as a frozenset for O(1) membership checks.
+
+        Computed once per loaded instance; the ARRAY column itself is unchanged.
+        """
+        return frozenset(self.allowed_regions or ())
+
+    @cached_property
+    def blocked_region_set(self) -> frozenset[str]:
+        """Blocked regions as a frozenset for O(1) membership checks.
+
+        Computed once per loaded instance; the ARRAY column itself is unchanged.
+        """
+        return frozenset(self.blocked_regions or ())
+
 
 class RegionalDeployment(AumOSModel):
     """Regional Kubernetes cluster deployment record.
@@ -198,6 +229,16 @@ class RoutingPolicy(AumOSModel):
     """
 
     __tablename__ = "sov_routing_policies"
+    __table_args__ = (
+        # Serves the per-request active-policy lookup (filter and ORDER BY priority).
+        Index(
+            "ix_sov_routing_policies_tenant_jurisdiction_active_priority",
+            "tenant_id",
+            "source_jurisdiction",
+            "is_active",
+            "priority",
+        ),
+    )
 
     name: Mapped[str] = mapped_column(
         String(255),
@@ -253,6 +294,21 @@ class RoutingPolicy(AumOSModel):
         comment="Additional policy metadata",
     )
 
+    @cached_property
+    def allowed_model_id_set(self) -> frozenset[str]:
+        """Allowed model IDs as a frozenset; empty means every model is allowed."""
+        return frozenset(self.allowed_model_ids or ())
+
+    @cached_property
+    def target_deployment_uuid(self) -> uuid.UUID | None:
+        """Target deployment ID parsed once per loaded instance."""
+        return uuid.UUID(self.target_deployment_id) if self.target_deployment_id else None
+
+    @cached_property
+    def fallback_deployment_uuid(self) -> uuid.UUID | None:
+        """Fallback deployment ID parsed once per loaded instance."""
+        return uuid.UUID(self.fallback_deployment_id) if self.fallback_deployment_id else None
+
 
 class ComplianceMap(AumOSModel):
     """Jurisdiction compliance requirement to deployment configuration mapping.
@@ -456,6 +512,164 @@ class GaiaXCredential(AumOSModel):
     )
 
 
+@dataclass(slots=True, frozen=True)
+class ResidencyRuleSnapshot:
+    """Immutable copy of the ResidencyRule fields used by residency checks.
+
+    Process-wide caches hold snapshots rather than ORM instances, so a cached
+    entry never depends on the session that loaded it and cannot be mutated
+    by a later request.
+    """
+
+    id: uuid.UUID
+    jurisdiction: str
+    data_classification: str
+    allowed_regions: tuple[str, ...]
+    blocked_regions: tuple[str, ...]
+    allowed_region_set: frozenset[str]
+    blocked_region_set: frozenset[str]
+    action_on_violation: ResidencyAction
+    priority: int
+
+    @classmethod
+    def from_model(cls, rule: ResidencyRule) -> "ResidencyRuleSnapshot":
+        """Copy a loaded ResidencyRule.
+
+        Args:
+            rule: Rule loaded in the current session.
+
+        Returns:
+            Session-independent snapshot of the rule.
+        """
+        return cls(
+            id=rule.id,
+            jurisdiction=rule.jurisdiction,
+            data_classification=rule.data_classification,
+            allowed_regions=tuple(rule.allowed_regions),
+            blocked_regions=tuple(rule.blocked_regions),
+            allowed_region_set=rule.allowed_region_set,
+            blocked_region_set=rule.blocked_region_set,
+            action_on_violation=rule.action_on_violation,
+            priority=rule.priority,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class RoutingPolicySnapshot:
+    """Immutable copy of the RoutingPolicy fields used by jurisdiction routing.
+
+    See ResidencyRuleSnapshot for why caches hold snapshots.
+    """
+
+    id: uuid.UUID
+    source_jurisdiction: str
+    strategy: RoutingStrategy
+    priority: int
+    allowed_model_id_set: frozenset[str]
+    target_deployment_uuid: uuid.UUID | None
+    fallback_deployment_uuid: uuid.UUID | None
+
+    @classmethod
+    def from_model(cls, policy: RoutingPolicy) -> "RoutingPolicySnapshot":
+        """Copy a loaded RoutingPolicy.
+
+        Args:
+            policy: Policy loaded in the current session.
+
+        Returns:
+            Session-independent snapshot of the policy.
+        """
+        return cls(
+            id=policy.id,
+            source_jurisdiction=policy.source_jurisdiction,
+            strategy=policy.strategy,
+            priority=policy.priority,
+            allowed_model_id_set=policy.allowed_model_id_set,
+            target_deployment_uuid=policy.target_deployment_uuid,
+            fallback_deployment_uuid=policy.fallback_deployment_uuid,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class RegionalDeploymentSnapshot:
+    """Immutable copy of the RegionalDeployment fields used by jurisdiction routing.
+
+    See ResidencyRuleSnapshot for why caches hold snapshots.
+    """
+
+    id: uuid.UUID
+    region: str
+    jurisdiction: str
+    status: DeploymentStatus
+    endpoint_url: str | None
+
+    @classmethod
+    def from_model(cls, deployment: RegionalDeployment) -> "RegionalDeploymentSnapshot":
+        """Copy a loaded RegionalDeployment.
+
+        Args:
+            deployment: Deployment loaded in the current session.
+
+        Returns:
+            Session-independent snapshot of the deployment.
+        """
+        return cls(
+            id=deployment.id,
+            region=deployment.region,
+            jurisdiction=deployment.jurisdiction,
+            status=deployment.status,
+            endpoint_url=deployment.endpoint_url,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class RoutingDecision:
+    """Outcome of jurisdiction detection plus routing for one inference request.
+
+    Built directly by SovereignRoutingService.detect_and_route instead of
+    merging the detection and routing dicts on every request. Carries every
+    field the detection, rule-evaluation and fallback adapters report; on the
+    fallback path ``selected_region`` is the adapter's ``fallback_region``.
+
+    Attributes:
+        jurisdiction: Detected (or default) request jurisdiction.
+        model_id: Model requested for inference.
+        selected_region: Region the request is routed to.
+        routing_method: How the region was chosen (rule, fallback, ...).
+        confidence: Detection confidence level: high, medium, low or none.
+        detection_source: Signal the jurisdiction came from, if known.
+        is_default: Whether no signal matched and the default jurisdiction was used.
+        routed: Whether primary routing rules produced the target.
+        deployment_id: Target deployment identifier, if the router supplied one.
+        rule_applied: Routing rule that selected the region, on the primary path.
+        candidate_regions: Regions considered for the jurisdiction.
+        eligible_regions: Candidate regions left after exclusions.
+        excluded_regions: Regions explicitly excluded from consideration.
+        fallback_region: Region chosen by fallback routing, if it ran.
+        failed_region: Region the fallback routed around, if any.
+        is_cross_jurisdiction: Whether the fallback left the request jurisdiction.
+        fallback_applied_at: ISO-8601 timestamp of the fallback, if it ran.
+    """
+
+    jurisdiction: str
+    model_id: str
+    selected_region: str
+    routing_method: str
+    confidence: str
+    detection_source: str | None = None
+    is_default: bool = False
+    routed: bool = False
+    deployment_id: str | None = None
+    rule_applied: str | None = None
+    candidate_regions: tuple[str, ...] = ()
+    eligible_regions: tuple[str, ...] = ()
+    excluded_regions: tuple[str, ...] = ()
+    fallback_region: str | None = None
+    failed_region: str | None = None
+    is_cross_jurisdiction: bool = False
+    fallback_applied_at: str | None = None
+
+
 __all__ = [
     "ComplianceMap",
     "ComplianceStatus",
@@ -463,9 +677,13 @@ __all__ = [
     "GaiaXCredential",
     "ModelApprovalStatus",
     "RegionalDeployment",
+    "RegionalDeploymentSnapshot",
     "ResidencyAction",
     "ResidencyRule",
+    "ResidencyRuleSnapshot",
+    "RoutingDecision",
     "RoutingPolicy",
+    "RoutingPolicySnapshot",
     "RoutingStrategy",
     "SovereignModel",
 ]
@@ -7,15 +7,21 @@ Services contain all domain logic. They:
   - Are framework-agnostic (no FastAPI, no direct DB access)
 
 After any state-changing operation, publish a Kafka event via the DomainEventPublisher.
+Publishes that do not affect the response may be scheduled with run_in_background.
 """
 
+import ctypes
 import uuid
+from collections.abc import Mapping, Sequence
 
 from aumos_common.auth import TenantContext
 from aumos_common.errors import NotFoundError
 from aumos_common.observability import get_logger
 
 from aumos_sovereign_ai.adapters.kafka import SovereignEventPublisher
+from aumos_sovereign_ai.core.background import run_in_background
+from aumos_sovereign_ai.core.cache import AsyncTTLCache, CacheKey, CommitHook, run_immediately
+from aumos_sovereign_ai.core.ids import new_correlation_id, new_entity_id
 from aumos_sovereign_ai.core.interfaces import (
     IComplianceAuditor,
     IComplianceMapRepository,
@@ -31,21 +37,31 @@ from aumos_sovereign_ai.core.interfaces import (
     ISovereignModelRepository,
     ISovereignRegistry,
 )
+from aumos_sovereign_ai.core.log_events import LogEvent, is_info_enabled
 from aumos_sovereign_ai.core.models import (
     ComplianceMap,
     ComplianceStatus,
     DeploymentStatus,
     ModelApprovalStatus,
     RegionalDeployment,
-    ResidencyAction,
+    RegionalDeploymentSnapshot,
     ResidencyRule,
+    ResidencyRuleSnapshot,
+    RoutingDecision,
     RoutingPolicy,
+    RoutingPolicySnapshot,
     RoutingStrategy,
     SovereignModel,
 )
 
 logger = get_logger(__name__)
 
+# Enum members compared on every routing request, bound once at import.
+_ACTIVE = DeploymentStatus.ACTIVE
+_PREFERRED_OR_FALLBACK: frozenset[RoutingStrategy] = frozenset(
+    {RoutingStrategy.PREFERRED, RoutingStrategy.FALLBACK}
+)
+
 
 class GeopatriationService:
     """Enforces and manages data residency rules per jurisdiction.
@@ -56,21 +72,69 @@ class GeopatriationService:
     Args:
         residency_repo: Repository for residency rule data access.
         publisher: Kafka event publisher for sovereignty events.
+        rule_cache: Optional short-TTL cache of applicable residency rules per
+            (tenant, jurisdiction, classification), shared across requests.
+        status_cache: Optional short-TTL cache of per-jurisdiction rule
+            counts and active rules, shared across requests.
+        after_commit: Defers cache invalidation until the caller's transaction
+            commits. Defaults to invalidating immediately.
     """
 
     def __init__(
         self,
         residency_repo: IResidencyRuleRepository,
         publisher: SovereignEventPublisher,
+        rule_cache: AsyncTTLCache[CacheKey, tuple[ResidencyRuleSnapshot, ...]] | None = None,
+        status_cache: AsyncTTLCache[CacheKey, tuple[int, tuple[ResidencyRuleSnapshot, ...]]] | None = None,
+        after_commit: CommitHook = run_immediately,
     ) -> None:
         """Initialize GeopatriationService.
 
         Args:
             residency_repo: Residency rule repository.
             publisher: Domain event publisher.
+            rule_cache: Optional TTL cache for enforcement rule lookups.
+            status_cache: Optional TTL cache for residency status lookups.
+            after_commit: Hook that runs cache invalidation after commit.
         """
         self._residency_repo = residency_repo
         self._publisher = publisher
+        self._log = logger.bind(service="GeopatriationService")
+        self._info_enabled = is_info_enabled(self._log)
+        self._rule_cache = rule_cache
+        self._status_cache = status_cache
+        self._after_commit = after_commit
+
+    async def _list_active_rules(
+        self, jurisdiction: str, data_classification: str, tenant: TenantContext
+    ) -> Sequence[ResidencyRule | ResidencyRuleSnapshot]:
+        """Load applicable active rules in priority order, via the rule cache when configured.
+
+        The cache stores immutable snapshots, never ORM instances, so cached
+        entries do not depend on the session that loaded them.
+
+        Args:
+            jurisdiction: Jurisdiction to load rules for.
+            data_classification: Data classification tier being enforced.
+            tenant: The tenant context for RLS isolation.
+
+        Returns:
+            Active residency rules for the jurisdiction and classification.
+        """
+        if self._rule_cache is None:
+            return await self._residency_repo.list_active_by_jurisdiction_and_classification(
+                jurisdiction, data_classification, tenant
+            )
+
+        async def load() -> tuple[ResidencyRuleSnapshot, ...]:
+            rules = await self._residency_repo.list_active_by_jurisdiction_and_classification(
+                jurisdiction, data_classification, tenant
+            )
+            return tuple(ResidencyRuleSnapshot.from_model(rule) for rule in rules)
+
+        return await self._rule_cache.get_or_load(
+            ("residency_rules", tenant.tenant_id, jurisdiction, data_classification), load
+        )
 
     async def enforce_residency(
         self,
@@ -94,72 +158,73 @@ class GeopatriationService:
         Returns:
             Enforcement result dict with compliant status, action, and violated rules.
         """
-        logger.info(
-            "Enforcing data residency",
-            jurisdiction=jurisdiction,
-            data_region=data_region,
-            data_classification=data_classification,
-            tenant_id=str(tenant.tenant_id),
-        )
-
-        rules = await self._residency_repo.list_by_jurisdiction(jurisdiction, tenant)
-        active_rules = [
-            r for r in rules
-            if r.is_active and r.data_classification in ("all", data_classification)
-        ]
+        tenant_id_str = str(tenant.tenant_id)
+        if self._info_enabled:
+            self._log.info(
+                LogEvent.RESIDENCY_ENFORCEMENT_STARTED,
+                jurisdiction=jurisdiction,
+                data_region=data_region,
+                data_classification=data_classification,
+                tenant_id=tenant_id_str,
+            )
 
-        # Sort by priority ascending (lower = higher priority)
-        active_rules.sort(key=lambda r: r.priority)
+        # Already filtered to active rules for this classification and ordered
+        # by priority ascending (lower = higher priority) by the repository.
+        active_rules = await self._list_active_rules(jurisdiction, data_classification, tenant)
 
-        violated_rules: list[dict] = []
-        required_action = ResidencyAction.BLOCK
-        compliant = True
+        # Evaluation stops at the first violating rule, so at most one violation
+        # is ever recorded. Its details (reason string, action value) are only
+        # built on that rule, so the compliant path does no formatting work.
+        violated_rule: dict | None = None
+        required_action_value: str | None = None
 
         for rule in active_rules:
-            if data_region in rule.blocked_regions:
-                compliant = False
-                violated_rules.append({
-                    "rule_id": str(rule.id),
-                    "jurisdiction": rule.jurisdiction,
-                    "reason": f"Region {data_region} is explicitly blocked",
-                    "action": rule.action_on_violation.value,
-                })
-                required_action = rule.action_on_violation
-                break
-            if rule.allowed_regions and data_region not in rule.allowed_regions:
-                compliant = False
-                violated_rules.append({
-                    "rule_id": str(rule.id),
-                    "jurisdiction": rule.jurisdiction,
-                    "reason": f"Region {data_region} not in allowed regions",
-                    "action": rule.action_on_violation.value,
-                })
-                required_action = rule.action_on_violation
-                break
-
+            if data_region in rule.blocked_region_set:
+                reason = f"Region {data_region} is explicitly blocked"
+            elif rule.allowed_region_set and data_region not in rule.allowed_region_set:
+                reason = f"Region {data_region} not in allowed regions"
+            else:
+                continue
+            required_action_value = rule.action_on_violation.value
+            violated_rule = {
+                "rule_id": str(rule.id),
+                "jurisdiction": rule.jurisdiction,
+                "reason": reason,
+                "action": required_action_value,
+            }
+            break
+
+        compliant = violated_rule is None
         result = {
             "compliant": compliant,
             "jurisdiction": jurisdiction,
             "data_region": data_region,
             "data_classification": data_classification,
-            "violated_rules": violated_rules,
-            "required_action": required_action.value if not compliant else None,
+            "violated_rules": [] if compliant else [violated_rule],
+            "required_action": required_action_value,
         }
 
+        correlation_id: str | None = None
         if not compliant:
-            await self._publisher.publish_residency_violation(
-                tenant_id=tenant.tenant_id,
-                jurisdiction=jurisdiction,
-                data_region=data_region,
-                action=required_action.value,
-                correlation_id=str(uuid.uuid4()),
+            correlation_id = new_correlation_id()
+            run_in_background(
+                self._publisher.publish_residency_violation(
+                    tenant_id=tenant.tenant_id,
+                    jurisdiction=jurisdiction,
+                    data_region=data_region,
+                    action=required_action_value,
+                    correlation_id=correlation_id,
+                ),
+                name="publish_residency_violation",
             )
 
-        logger.info(
-            "Residency enforcement complete",
-            compliant=compliant,
-            tenant_id=str(tenant.tenant_id),
-        )
+        if self._info_enabled:
+            self._log.info(
+                LogEvent.RESIDENCY_ENFORCEMENT_COMPLETE,
+                compliant=compliant,
+                correlation_id=correlation_id,
+                tenant_id=tenant_id_str,
+            )
         return result
 
     async def get_residency_status(
@@ -176,19 +241,32 @@ class GeopatriationService:
         Returns:
             Status dict with active rules count and rule summaries.
         """
-        rules = await self._residency_repo.list_by_jurisdiction(jurisdiction, tenant)
-        active_rules = [r for r in rules if r.is_active]
+        if self._status_cache is None:
+            total_rules, active_rules = await self._residency_repo.count_and_list_active(
+                jurisdiction, tenant
+            )
+        else:
+
+            async def load() -> tuple[int, tuple[ResidencyRuleSnapshot, ...]]:
+                count, rules = await self._residency_repo.count_and_list_active(jurisdiction, tenant)
+                return count, tuple(ResidencyRuleSnapshot.from_model(rule) for rule in rules)
+
+            total_rules, active_rules = await self._status_cache.get_or_load(
+                ("residency_status", tenant.tenant_id, jurisdiction), load
+            )
+
+        allowed_regions: set[str] = set()
+        blocked_regions: set[str] = set()
+        for rule in active_rules:
+            allowed_regions.update(rule.allowed_regions)
+            blocked_regions.update(rule.blocked_regions)
 
         return {
             "jurisdiction": jurisdiction,
-            "total_rules": len(rules),
+            "total_rules": total_rules,
             "active_rules": len(active_rules),
-            "allowed_regions": list({
-                region for r in active_rules for region in r.allowed_regions
-            }),
-            "blocked_regions": list({
-                region for r in active_rules for region in r.blocked_regions
-            }),
+            "allowed_regions": list(allowed_regions),
+            "blocked_regions": list(blocked_regions),
         }
 
     async def create_residency_rule(
@@ -218,15 +296,30 @@ class GeopatriationService:
             blocked_regions=blocked_regions,
             tenant=tenant,
         )
+        tenant_id = tenant.tenant_id
+
+        rule_cache = self._rule_cache
+        status_cache = self._status_cache
+
+        def is_stale(key: CacheKey) -> bool:
+            return key[1] == tenant_id and key[2] == jurisdiction
+
+        def invalidate() -> None:
+            if rule_cache is not None:
+                rule_cache.invalidate(is_stale)
+            if status_cache is not None:
+                status_cache.invalidate(is_stale)
+
+        self._after_commit(invalidate)
 
         await self._publisher.publish_residency_rule_created(
             tenant_id=tenant.tenant_id,
             rule_id=rule.id,
             jurisdiction=jurisdiction,
-            correlation_id=str(uuid.uuid4()),
+            correlation_id=new_correlation_id(),
         )
 
-        logger.info(
+        self._log.info(
             "Residency rule created",
             rule_id=str(rule.id),
             jurisdiction=jurisdiction,
@@ -244,21 +337,32 @@ class RegionalDeployerService:
     Args:
         deployment_repo: Repository for regional deployment data access.
         publisher: Kafka event publisher for deployment events.
+        deployment_cache: Optional deployment cache shared with
+            JurisdictionRouterService; entries are dropped on status updates.
+        after_commit: Defers cache invalidation until the caller's transaction
+            commits. Defaults to invalidating immediately.
     """
 
     def __init__(
         self,
         deployment_repo: IRegionalDeploymentRepository,
         publisher: SovereignEventPublisher,
+        deployment_cache: AsyncTTLCache[CacheKey, RegionalDeploymentSnapshot] | None = None,
+        after_commit: CommitHook = run_immediately,
     ) -> None:
         """Initialize RegionalDeployerService.
 
         Args:
             deployment_repo: Regional deployment repository.
             publisher: Domain event publisher.
+            deployment_cache: Optional deployment cache to invalidate on updates.
+            after_commit: Hook that runs cache invalidation after commit.
         """
         self._deployment_repo = deployment_repo
         self._publisher = publisher
+        self._log = logger.bind(service="RegionalDeployerService")
+        self._deployment_cache = deployment_cache
+        self._after_commit = after_commit
 
     async def deploy_to_region(
         self,
@@ -285,12 +389,13 @@ class RegionalDeployerService:
         Returns:
             The created RegionalDeployment record in PENDING status.
         """
-        logger.info(
+        tenant_id_str = str(tenant.tenant_id)
+        self._log.info(
             "Initiating regional deployment",
             region=region,
             jurisdiction=jurisdiction,
             cluster_name=cluster_name,
-            tenant_id=str(tenant.tenant_id),
+            tenant_id=tenant_id_str,
         )
 
         deployment = await self._deployment_repo.create(
@@ -307,14 +412,14 @@ class RegionalDeployerService:
             deployment_id=deployment.id,
             region=region,
             jurisdiction=jurisdiction,
-            correlation_id=str(uuid.uuid4()),
+            correlation_id=new_correlation_id(),
         )
 
-        logger.info(
+        self._log.info(
             "Regional deployment initiated",
             deployment_id=str(deployment.id),
             region=region,
-            tenant_id=str(tenant.tenant_id),
+            tenant_id=tenant_id_str,
         )
         return deployment
 
@@ -391,17 +496,24 @@ class RegionalDeployerService:
                 resource="RegionalDeployment",
                 resource_id=str(deployment_id),
             )
-
-        if status == DeploymentStatus.ACTIVE:
-            await self._publisher.publish_deployment_active(
-                tenant_id=tenant.tenant_id,
-                deployment_id=deployment_id,
-                region=updated.region,
-                endpoint_url=endpoint_url or "",
-                correlation_id=str(uuid.uuid4()),
+        deployment_cache = self._deployment_cache
+        if deployment_cache is not None:
+            cache_key = ("deployment", tenant.tenant_id, deployment_id)
+            self._after_commit(lambda: deployment_cache.pop(cache_key))
+
+        if status == _ACTIVE:
+            run_in_background(
+                self._publisher.publish_deployment_active(
+                    tenant_id=tenant.tenant_id,
+                    deployment_id=deployment_id,
+                    region=updated.region,
+                    endpoint_url=endpoint_url or "",
+                    correlation_id=new_correlation_id(),
+                ),
+                name="publish_deployment_active",
             )
 
-        logger.info(
+        self._log.info(
             "Regional deployment status updated",
             deployment_id=str(deployment_id),
             status=status.value,
@@ -421,6 +533,12 @@ class JurisdictionRouterService:
         routing_repo: Repository for routing policy data access.
         deployment_repo: Repository for regional deployment data access.
         publisher: Kafka event publisher for routing events.
+        policy_cache: Optional short-TTL cache of routing policies per
+            (tenant, jurisdiction).
+        deployment_cache: Optional short-TTL cache of deployments by ID.
+            Keep its TTL low: routing depends on deployment status.
+        after_commit: Defers cache invalidation until the caller's transaction
+            commits. Defaults to invalidating immediately.
     """
 
     def __init__(
@@ -428,6 +546,9 @@ class JurisdictionRouterService:
         routing_repo: IRoutingPolicyRepository,
         deployment_repo: IRegionalDeploymentRepository,
         publisher: SovereignEventPublisher,
+        policy_cache: AsyncTTLCache[CacheKey, tuple[RoutingPolicySnapshot, ...]] | None = None,
+        deployment_cache: AsyncTTLCache[CacheKey, RegionalDeploymentSnapshot] | None = None,
+        after_commit: CommitHook = run_immediately,
     ) -> None:
         """Initialize JurisdictionRouterService.
 
@@ -435,10 +556,75 @@ class JurisdictionRouterService:
             routing_repo: Routing policy repository.
             deployment_repo: Regional deployment repository.
             publisher: Domain event publisher.
+            policy_cache: Optional TTL cache for routing policy lookups.
+            deployment_cache: Optional TTL cache for deployment lookups.
+            after_commit: Hook that runs cache invalidation after commit.
         """
         self._routing_repo = routing_repo
         self._deployment_repo = deployment_repo
         self._publisher = publisher
+        self._log = logger.bind(service="JurisdictionRouterService")
+        self._info_enabled = is_info_enabled(self._log)
+        self._policy_cache = policy_cache
+        self._deployment_cache = deployment_cache
+        self._after_commit = after_commit
+
+    async def _list_active_policies(
+        self, jurisdiction: str, tenant: TenantContext
+    ) -> Sequence[RoutingPolicy | RoutingPolicySnapshot]:
+        """Load active routing policies in priority order, via the policy cache when configured.
+
+        The cache stores immutable snapshots, never ORM instances.
+
+        Args:
+            jurisdiction: Source jurisdiction.
+            tenant: The tenant context for RLS isolation.
+
+        Returns:
+            Active routing policies for the jurisdiction.
+        """
+        if self._policy_cache is None:
+            return await self._routing_repo.list_active_by_jurisdiction(jurisdiction, tenant)
+
+        async def load() -> tuple[RoutingPolicySnapshot, ...]:
+            policies = await self._routing_repo.list_active_by_jurisdiction(jurisdiction, tenant)
+            return tuple(RoutingPolicySnapshot.from_model(policy) for policy in policies)
+
+        return await self._policy_cache.get_or_load(("routing_policies", tenant.tenant_id, jurisdiction), load)
+
+    async def _get_deployments(
+        self, deployment_ids: set[uuid.UUID], tenant: TenantContext
+    ) -> Mapping[uuid.UUID, RegionalDeployment | RegionalDeploymentSnapshot]:
+        """Load deployments by ID in one batch, serving cached entries first.
+
+        The cache stores immutable snapshots, never ORM instances.
+
+        Args:
+            deployment_ids: Deployment primary keys to resolve.
+            tenant: The tenant context for RLS isolation.
+
+        Returns:
+            Mapping of deployment ID to deployment; unknown IDs are absent.
+        """
+        if self._deployment_cache is None:
+            return await self._deployment_repo.list_by_ids(deployment_ids, tenant)
+
+        found: dict[uuid.UUID, RegionalDeploymentSnapshot] = {}
+        missing: list[uuid.UUID] = []
+        for deployment_id in deployment_ids:
+            cached = self._deployment_cache.get(("deployment", tenant.tenant_id, deployment_id))
+            if cached is None:
+                missing.append(deployment_id)
+            else:
+                found[deployment_id] = cached
+        if missing:
+            generation = self._deployment_cache.generation
+            loaded = await self._deployment_repo.list_by_ids(missing, tenant)
+            for deployment_id, deployment in loaded.items():
+                snapshot = RegionalDeploymentSnapshot.from_model(deployment)
+                self._deployment_cache.set(("deployment", tenant.tenant_id, deployment_id), snapshot, generation)
+                found[deployment_id] = snapshot
+        return found
 
     async def route_by_jurisdiction(
         self,
@@ -462,18 +648,16 @@ class JurisdictionRouterService:
         Raises:
             NotFoundError: If no active routing policy or deployment is found.
         """
-        logger.info(
-            "Routing request by jurisdiction",
-            jurisdiction=jurisdiction,
-            model_id=model_id,
-            tenant_id=str(tenant.tenant_id),
-        )
+        tenant_id_str = str(tenant.tenant_id)
+        if self._info_enabled:
+            self._log.info(
+                LogEvent.JURISDICTION_ROUTING_STARTED,
+                jurisdiction=jurisdiction,
+                model_id=model_id,
+                tenant_id=tenant_id_str,
+            )
 
-        policies = await self._routing_repo.list_by_jurisdiction(jurisdiction, tenant)
-        active_policies = sorted(
-            [p for p in policies if p.is_active],
-            key=lambda p: p.priority,
-        )
+        active_policies = await self._list_active_policies(jurisdiction, tenant)
 
         if not active_policies:
             raise NotFoundError(
@@ -481,33 +665,50 @@ class JurisdictionRouterService:
                 resource_id=f"jurisdiction={jurisdiction}",
             )
 
-        for policy in active_policies:
-            if policy.allowed_model_ids and model_id not in policy.allowed_model_ids:
-                continue
+        # Drop policies that cannot serve this model before touching the database.
+        candidate_policies = [
+            p for p in active_policies
+            if not p.allowed_model_id_set or model_id in p.allowed_model_id_set
+        ]
 
-            target_id = policy.target_deployment_id
+        # Resolve every candidate target and fallback deployment in one round-trip.
+        deployment_ids: set[uuid.UUID] = set()
+        for policy in candidate_policies:
+            if policy.target_deployment_uuid is not None:
+                deployment_ids.add(policy.target_deployment_uuid)
+            if (
+                policy.strategy in _PREFERRED_OR_FALLBACK
+                and policy.fallback_deployment_uuid is not None
+            ):
+                deployment_ids.add(policy.fallback_deployment_uuid)
+        deployments = await self._get_deployments(deployment_ids, tenant) if deployment_ids else {}
+
+        for policy in candidate_policies:
+            target_id = policy.target_deployment_uuid
             if target_id is None:
                 continue
 
-            deployment = await self._deployment_repo.get_by_id(
-                uuid.UUID(target_id), tenant
-            )
-            if deployment and deployment.status == DeploymentStatus.ACTIVE:
-                await self._publisher.publish_routing_decision(
-                    tenant_id=tenant.tenant_id,
-                    jurisdiction=jurisdiction,
-                    deployment_id=deployment.id,
-                    model_id=model_id,
-                    correlation_id=str(uuid.uuid4()),
+            deployment = deployments.get(target_id)
+            if deployment and deployment.status == _ACTIVE:
+                run_in_background(
+                    self._publisher.publish_routing_decision(
+                        tenant_id=tenant.tenant_id,
+                        jurisdiction=jurisdiction,
+                        deployment_id=deployment.id,
+                        model_id=model_id,
+                        correlation_id=new_correlation_id(),
+                    ),
+                    name="publish_routing_decision",
                 )
 
-                logger.info(
-                    "Routing decision made",
-                    jurisdiction=jurisdiction,
-                    deployment_id=str(deployment.id),
-                    endpoint=deployment.endpoint_url,
-                    tenant_id=str(tenant.tenant_id),
-                )
+                if self._info_enabled:
+                    self._log.info(
+                        LogEvent.JURISDICTION_ROUTING_DECIDED,
+                        jurisdiction=jurisdiction,
+                        deployment_id=str(deployment.id),
+                        endpoint=deployment.endpoint_url,
+                        tenant_id=tenant_id_str,
+                    )
                 return {
                     "jurisdiction": jurisdiction,
                     "model_id": model_id,
@@ -520,19 +721,18 @@ class JurisdictionRouterService:
 
             # Try fallback if strategy permits
             if (
-                policy.strategy in (RoutingStrategy.PREFERRED, RoutingStrategy.FALLBACK)
-                and policy.fallback_deployment_id
+                policy.strategy in _PREFERRED_OR_FALLBACK
+                and policy.fallback_deployment_uuid is not None
             ):
-                fallback = await self._deployment_repo.get_by_id(
-                    uuid.UUID(policy.fallback_deployment_id), tenant
-                )
-                if fallback and fallback.status == DeploymentStatus.ACTIVE:
-                    logger.info(
-                        "Using fallback deployment",
-                        jurisdiction=jurisdiction,
-                        fallback_deployment_id=str(fallback.id),
-                        tenant_id=str(tenant.tenant_id),
-                    )
+                fallback = deployments.get(policy.fallback_deployment_uuid)
+                if fallback and fallback.status == _ACTIVE:
+                    if self._info_enabled:
+                        self._log.info(
+                            LogEvent.JURISDICTION_ROUTING_FALLBACK,
+                            jurisdiction=jurisdiction,
+                            fallback_deployment_id=str(fallback.id),
+                            tenant_id=tenant_id_str,
+                        )
                     return {
                         "jurisdiction": jurisdiction,
                         "model_id": model_id,
@@ -572,8 +772,12 @@ class JurisdictionRouterService:
             strategy=strategy.value,
             tenant=tenant,
         )
+        policy_cache = self._policy_cache
+        if policy_cache is not None:
+            cache_key = ("routing_policies", tenant.tenant_id, source_jurisdiction)
+            self._after_commit(lambda: policy_cache.pop(cache_key))
 
-        logger.info(
+        self._log.info(
             "Routing policy created",
             policy_id=str(policy.id),
             jurisdiction=source_jurisdiction,
@@ -607,6 +811,7 @@ class ComplianceMapperService:
         """
         self._compliance_repo = compliance_repo
         self._publisher = publisher
+        self._log = logger.bind(service="ComplianceMapperService")
 
     async def get_compliance_mapping(
         self,
@@ -622,7 +827,7 @@ class ComplianceMapperService:
         Returns:
             List of ComplianceMap records for the jurisdiction.
         """
-        logger.info(
+        self._log.info(
             "Retrieving compliance mappings",
             jurisdiction=jurisdiction,
             tenant_id=str(tenant.tenant_id),
@@ -659,10 +864,10 @@ class ComplianceMapperService:
             mapping_id=mapping.id,
             jurisdiction=jurisdiction,
             regulation_name=regulation_name,
-            correlation_id=str(uuid.uuid4()),
+            correlation_id=new_correlation_id(),
         )
 
-        logger.info(
+        self._log.info(
             "Compliance mapping created",
             mapping_id=str(mapping.id),
             jurisdiction=jurisdiction,
@@ -704,7 +909,7 @@ class ComplianceMapperService:
                 resource_id=str(mapping_id),
             )
 
-        logger.info(
+        self._log.info(
             "Compliance mapping verified",
             mapping_id=str(mapping_id),
             status=compliance_status.value,
@@ -738,6 +943,7 @@ class SovereignRegistryService:
         """
         self._model_repo = model_repo
         self._publisher = publisher
+        self._log = logger.bind(service="SovereignRegistryService")
 
     async def register_model(
         self,
@@ -764,11 +970,12 @@ class SovereignRegistryService:
         Returns:
             The newly created SovereignModel registration in PENDING status.
         """
-        logger.info(
+        tenant_id_str = str(tenant.tenant_id)
+        self._log.info(
             "Registering sovereign model",
             model_id=model_id,
             jurisdiction=jurisdiction,
-            tenant_id=str(tenant.tenant_id),
+            tenant_id=tenant_id_str,
         )
 
         sovereign_model = await self._model_repo.create(
@@ -785,15 +992,15 @@ class SovereignRegistryService:
             model_reg_id=sovereign_model.id,
             model_id=model_id,
             jurisdiction=jurisdiction,
-            correlation_id=str(uuid.uuid4()),
+            correlation_id=new_correlation_id(),
         )
 
-        logger.info(
+        self._log.info(
             "Sovereign model registered",
             model_reg_id=str(sovereign_model.id),
             model_id=model_id,
             jurisdiction=jurisdiction,
-            tenant_id=str(tenant.tenant_id),
+            tenant_id=tenant_id_str,
         )
         return sovereign_model
 
@@ -852,10 +1059,10 @@ class SovereignRegistryService:
             model_id=updated.model_id,
             jurisdiction=updated.jurisdiction,
             approved_by=approved_by,
-            correlation_id=str(uuid.uuid4()),
+            correlation_id=new_correlation_id(),
         )
 
-        logger.info(
+        self._log.info(
             "Sovereign model approved",
             model_reg_id=str(model_reg_id),
             model_id=updated.model_id,
@@ -890,6 +1097,8 @@ class DataSovereigntyService:
         """
         self._enforcer = enforcer
         self._publisher = publisher
+        self._log = logger.bind(service="DataSovereigntyService")
+        self._info_enabled = is_info_enabled(self._log)
 
     async def enforce_transfer(
         self,
@@ -916,22 +1125,31 @@ class DataSovereigntyService:
             tenant=tenant,
         )
 
-        if not result.get("transfer_allowed", True):
-            await self._publisher.publish_residency_violation(
-                tenant_id=tenant.tenant_id,
-                jurisdiction=source_jurisdiction,
-                data_region=target_jurisdiction,
-                action="block_transfer",
-                correlation_id=str(uuid.uuid4()),
+        allowed = result.get("transfer_allowed", True)
+        if not allowed:
+            # The violation event is the audit record for a blocked transfer; the
+            # publisher logs it once delivered, so no separate service log line.
+            run_in_background(
+                self._publisher.publish_residency_violation(
+                    tenant_id=tenant.tenant_id,
+                    jurisdiction=source_jurisdiction,
+                    data_region=target_jurisdiction,
+                    action="block_transfer",
+                    correlation_id=new_correlation_id(),
+                    data_classification=data_classification,
+                ),
+                name="publish_residency_violation",
+            )
+            return result
+
+        if self._info_enabled:
+            self._log.info(
+                LogEvent.TRANSFER_ENFORCEMENT_COMPLETE,
+                source_jurisdiction=source_jurisdiction,
+                target_jurisdiction=target_jurisdiction,
+                allowed=allowed,
+                tenant_id=str(tenant.tenant_id),
             )
-
-        logger.info(
-            "Cross-border transfer enforcement complete",
-            source_jurisdiction=source_jurisdiction,
-            target_jurisdiction=target_jurisdiction,
-            allowed=result.get("transfer_allowed"),
-            tenant_id=str(tenant.tenant_id),
-        )
         return result
 
     async def define_rule(
@@ -964,12 +1182,12 @@ class DataSovereigntyService:
 
         await self._publisher.publish_residency_rule_created(
             tenant_id=tenant.tenant_id,
-            rule_id=uuid.UUID(rule.get("rule_id", str(uuid.uuid4()))),
+            rule_id=rule.get("rule_id") or new_entity_id(),
             jurisdiction=jurisdiction,
-            correlation_id=str(uuid.uuid4()),
+            correlation_id=new_correlation_id(),
         )
 
-        logger.info(
+        self._log.info(
             "Sovereignty rule defined",
             jurisdiction=jurisdiction,
             data_classification=data_classification,
@@ -1038,6 +1256,8 @@ class LocalModelService:
         self._deployer = deployer
         self._offline_runtime = offline_runtime
         self._publisher = publisher
+        self._log = logger.bind(service="LocalModelService")
+        self._info_enabled = is_info_enabled(self._log)
 
     async def download_and_prepare(
         self,
@@ -1064,15 +1284,18 @@ class LocalModelService:
             tenant=tenant,
         )
 
-        await self._publisher.publish_sovereign_model_registered(
-            tenant_id=tenant.tenant_id,
-            model_reg_id=uuid.UUID(result.get("cache_id", str(uuid.uuid4()))),
-            model_id=model_id,
-            jurisdiction=result.get("cached_jurisdiction", "LOCAL"),
-            correlation_id=str(uuid.uuid4()),
+        run_in_background(
+            self._publisher.publish_sovereign_model_registered(
+                tenant_id=tenant.tenant_id,
+                model_reg_id=result.get("cache_id") or new_entity_id(),
+                model_id=model_id,
+                jurisdiction=result.get("cached_jurisdiction", "LOCAL"),
+                correlation_id=new_correlation_id(),
+            ),
+            name="publish_sovereign_model_registered",
         )
 
-        logger.info(
+        self._log.info(
             "Model downloaded and cached",
             model_id=model_id,
             model_version=model_version,
@@ -1137,13 +1360,14 @@ class LocalModelService:
             tenant=tenant,
         )
 
-        logger.info(
-            "Offline inference completed",
-            model_id=model_id,
-            tokens_generated=result.get("tokens_generated", 0),
-            latency_ms=result.get("latency_ms", 0),
-            tenant_id=str(tenant.tenant_id),
-        )
+        if self._info_enabled:
+            self._log.info(
+                LogEvent.OFFLINE_INFERENCE_COMPLETED,
+                model_id=model_id,
+                tokens_generated=result.get("tokens_generated", 0),
+                latency_ms=result.get("latency_ms", 0),
+                tenant_id=str(tenant.tenant_id),
+            )
         return result
 
     async def get_offline_health(self, tenant: TenantContext) -> dict:
@@ -1169,6 +1393,36 @@ class LocalModelService:
         return await self._offline_runtime.list_cached_models(tenant)
 
 
+def _writable_key_view(buffer: bytearray | memoryview) -> memoryview:
+    """Return a flat byte view of a key-material buffer that can be wiped in place.
+
+    Args:
+        buffer: Buffer holding secret key material.
+
+    Returns:
+        A writable, C-contiguous unsigned-byte view over the buffer.
+
+    Raises:
+        TypeError: If the buffer is read-only (such as ``bytes``) or not contiguous.
+    """
+    if not isinstance(buffer, bytearray | memoryview):
+        raise TypeError(f"Key material must be a bytearray or memoryview, got {type(buffer).__name__}")
+    view = memoryview(buffer)
+    if view.readonly or not view.c_contiguous:
+        raise TypeError("Key material buffer must be writable and C-contiguous so it can be wiped")
+    return view.cast("B")
+
+
+def _wipe_buffer(view: memoryview) -> None:
+    """Zero a writable key-material view in place.
+
+    Args:
+        view: View returned by ``_writable_key_view``.
+    """
+    if view.nbytes:
+        ctypes.memset((ctypes.c_char * view.nbytes).from_buffer(view), 0, view.nbytes)
+
+
 class KeyManagementService:
     """Orchestrate sovereign encryption key lifecycle and BYOK operations.
 
@@ -1193,6 +1447,7 @@ class KeyManagementService:
         """
         self._key_manager = key_manager
         self._publisher = publisher
+        self._log = logger.bind(service="KeyManagementService")
 
     async def import_customer_key(
         self,
@@ -1222,7 +1477,56 @@ class KeyManagementService:
             tenant=tenant,
         )
 
-        logger.info(
+        self._log.info(
+            "Customer key imported",
+            key_id=key_id,
+            algorithm=algorithm,
+            jurisdiction=jurisdiction,
+            tenant_id=str(tenant.tenant_id),
+        )
+        return result
+
+    async def import_customer_key_bytes(
+        self,
+        key_id: str,
+        algorithm: str,
+        key_material: bytearray | memoryview,
+        jurisdiction: str,
+        tenant: TenantContext,
+    ) -> dict:
+        """Import raw customer key material (BYOK) without a base64 round-trip.
+
+        Callers that already hold the key as bytes (for example from a
+        multipart upload) hand the buffer straight to the key manager. The
+        buffer is zeroed once the import returns or fails, so the secret does
+        not linger on the Python heap.
+
+        Args:
+            key_id: Customer-assigned key identifier.
+            algorithm: Key algorithm (AES-256 | RSA-4096 | ECDSA-P384).
+            key_material: Raw key bytes in a writable, contiguous buffer.
+            jurisdiction: Jurisdiction governing this key.
+            tenant: Tenant context for RLS isolation.
+
+        Returns:
+            Key import result with fingerprint and status.
+
+        Raises:
+            TypeError: If key_material is read-only or not contiguous.
+        """
+        view = _writable_key_view(key_material)
+        try:
+            result = await self._key_manager.import_key_bytes(
+                key_id=key_id,
+                algorithm=algorithm,
+                key_material=key_material,
+                jurisdiction=jurisdiction,
+                tenant=tenant,
+            )
+        finally:
+            _wipe_buffer(view)
+
+        self._log.info(
             "Customer key imported",
             key_id=key_id,
             algorithm=algorithm,
@@ -1243,7 +1547,7 @@ class KeyManagementService:
         """
         result = await self._key_manager.rotate_key(key_id, tenant)
 
-        logger.info(
+        self._log.info(
             "Key rotated",
             key_id=key_id,
             new_version=result.get("new_version"),
@@ -1269,7 +1573,7 @@ class KeyManagementService:
         """
         result = await self._key_manager.revoke_key(key_id=key_id, reason=reason, tenant=tenant)
 
-        logger.info(
+        self._log.info(
             "Key revoked",
             key_id=key_id,
             reason=reason,
@@ -1318,6 +1622,7 @@ class SovereignComplianceService:
         self._auditor = auditor
         self._compliance_repo = compliance_repo
         self._publisher = publisher
+        self._log = logger.bind(service="SovereignComplianceService")
 
     async def run_audit(
         self,
@@ -1341,15 +1646,18 @@ class SovereignComplianceService:
             tenant=tenant,
         )
 
-        await self._publisher.publish_compliance_mapping_created(
-            tenant_id=tenant.tenant_id,
-            mapping_id=uuid.UUID(audit_result.get("audit_id", str(uuid.uuid4()))),
-            jurisdiction=jurisdiction,
-            regulation_name=audit_result.get("framework", "UNKNOWN"),
-            correlation_id=str(uuid.uuid4()),
+        run_in_background(
+            self._publisher.publish_compliance_mapping_created(
+                tenant_id=tenant.tenant_id,
+                mapping_id=audit_result.get("audit_id") or new_entity_id(),
+                jurisdiction=jurisdiction,
+                regulation_name=audit_result.get("framework", "UNKNOWN"),
+                correlation_id=new_correlation_id(),
+            ),
+            name="publish_compliance_mapping_created",
         )
 
-        logger.info(
+        self._log.info(
             "Compliance audit completed",
             jurisdiction=jurisdiction,
             compliance_score=audit_result.get("compliance_score"),
@@ -1431,6 +1739,8 @@ class SovereignRoutingService:
         self._router = router
         self._regional_deployer = regional_deployer
         self._publisher = publisher
+        self._log = logger.bind(service="SovereignRoutingService")
+        self._info_enabled = is_info_enabled(self._log)
 
     async def detect_and_route(
         self,
@@ -1440,7 +1750,7 @@ class SovereignRoutingService:
         http_headers: dict | None = None,
         source_ip: str | None = None,
         tenant: TenantContext,
-    ) -> dict:
+    ) -> RoutingDecision:
         """Detect request origin jurisdiction and resolve the routing target.
 
         Args:
@@ -1451,10 +1761,9 @@ class SovereignRoutingService:
             tenant: Tenant context for RLS isolation.
 
         Returns:
-            Full routing decision dict with jurisdiction, selected_region,
-            and confidence.
+            RoutingDecision with jurisdiction, selected_region, and confidence.
         """
-        origin = await self._router.detect_request_origin(
+        origin = self._router.detect_request_origin(
             jwt_claims=jwt_claims,
             http_headers=http_headers,
             source_ip=source_ip,
@@ -1467,39 +1776,63 @@ class SovereignRoutingService:
             tenant=tenant,
         )
 
-        if not routing.get("routed", False):
+        routed = routing.get("routed", False)
+        if not routed:
             routing = await self._router.apply_fallback_routing(
                 jurisdiction=jurisdiction,
                 model_id=model_id,
                 tenant=tenant,
             )
 
-        selected_region = routing.get("selected_region", "")
+        # The fallback adapter reports its target as fallback_region.
+        selected_region = routing.get("selected_region") or routing.get("fallback_region", "")
+        routing_method = routing.get("routing_method", "unknown")
+        confidence = str(origin.get("confidence", "none"))
+        deployment_id = routing.get("deployment_id")
         await self._router.log_routing_decision(
             jurisdiction=jurisdiction,
             model_id=model_id,
             selected_region=selected_region,
-            routing_method=routing.get("routing_method", "unknown"),
-            confidence=origin.get("confidence", 0.5),
+            routing_method=routing_method,
+            confidence=confidence,
             tenant=tenant,
         )
 
         await self._publisher.publish_routing_decision(
             tenant_id=tenant.tenant_id,
             jurisdiction=jurisdiction,
-            deployment_id=uuid.UUID(routing.get("deployment_id", str(uuid.uuid4()))),
+            deployment_id=deployment_id or new_entity_id(),
             model_id=model_id,
-            correlation_id=str(uuid.uuid4()),
+            correlation_id=new_correlation_id(),
         )
 
-        logger.info(
-            "Sovereign routing decision",
+        if self._info_enabled:
+            self._log.info(
+                LogEvent.ROUTING_DECISION,
+                jurisdiction=jurisdiction,
+                model_id=model_id,
+                selected_region=selected_region,
+                tenant_id=str(tenant.tenant_id),
+            )
+        return RoutingDecision(
             jurisdiction=jurisdiction,
             model_id=model_id,
             selected_region=selected_region,
-            tenant_id=str(tenant.tenant_id),
+            routing_method=routing_method,
+            confidence=confidence,
+            detection_source=origin.get("detection_source"),
+            is_default=origin.get("is_default", False),
+            routed=routed,
+            deployment_id=deployment_id,
+            rule_applied=routing.get("rule_applied"),
+            candidate_regions=tuple(routing.get("candidate_regions", ())),
+            eligible_regions=tuple(routing.get("eligible_regions", ())),
+            excluded_regions=tuple(routing.get("excluded_regions", ())),
+            fallback_region=routing.get("fallback_region"),
+            failed_region=routing.get("failed_region"),
+            is_cross_jurisdiction=routing.get("is_cross_jurisdiction", False),
+            fallback_applied_at=routing.get("fallback_applied_at"),
         )
-        return {**origin, **routing}
 
     async def deploy_to_regions(
         self,
@@ -1529,16 +1862,21 @@ class SovereignRoutingService:
             tenant=tenant,
         )
 
-        for result in results:
-            await self._publisher.publish_deployment_initiated(
-                tenant_id=tenant.tenant_id,
-                deployment_id=uuid.UUID(result.get("deployment_id", str(uuid.uuid4()))),
-                region=result.get("region", ""),
-                jurisdiction=jurisdiction,
-                correlation_id=str(uuid.uuid4()),
-            )
+        # Skipped and failed regions carry no deployment_id and get no event.
+        async with self._publisher.batch() as events:
+            for result in results:
+                deployment_id = result.get("deployment_id")
+                if not deployment_id:
+                    continue
+                await events.publish_deployment_initiated(
+                    tenant_id=tenant.tenant_id,
+                    deployment_id=deployment_id,
+                    region=result.get("region", ""),
+                    jurisdiction=jurisdiction,
+                    correlation_id=new_correlation_id(),
+                )
 
-        logger.info(
+        self._log.info(
             "Multi-region sovereign deployment initiated",
             regions=regions,
             jurisdiction=jurisdiction,
@@ -1569,6 +1907,9 @@ class ModelRegistryService:
         registry: Sovereign model registry adapter.
         model_repo: Sovereign model ORM repository.
         publisher: Kafka event publisher.
+        cache: Optional TTL cache for registry queries and certification
+            lookups. Entries for a tenant are dropped on every registry
+            mutation made through this service.
     """
 
     def __init__(
@@ -1576,6 +1917,7 @@ class ModelRegistryService:
         registry: ISovereignRegistry,
         model_repo: ISovereignModelRepository,
         publisher: SovereignEventPublisher,
+        cache: AsyncTTLCache[CacheKey, list[dict]] | None = None,
     ) -> None:
         """Initialize ModelRegistryService.
 
@@ -1583,10 +1925,23 @@ class ModelRegistryService:
             registry: Sovereign model registry adapter.
             model_repo: Sovereign model repository.
             publisher: Domain event publisher.
+            cache: Optional TTL cache for read-only registry lookups.
         """
         self._registry = registry
         self._model_repo = model_repo
         self._publisher = publisher
+        self._log = logger.bind(service="ModelRegistryService")
+        self._cache = cache
+
+    def _invalidate_tenant_cache(self, tenant: TenantContext) -> None:
+        """Drop every cached registry lookup belonging to a tenant.
+
+        Args:
+            tenant: Tenant whose cached entries are stale.
+        """
+        if self._cache is not None:
+            tenant_id = tenant.tenant_id
+            self._cache.invalidate(lambda key: key[1] == tenant_id)
 
     async def register_and_certify(
         self,
@@ -1628,16 +1983,17 @@ class ModelRegistryService:
             certified_by=certified_by,
             tenant=tenant,
         )
+        self._invalidate_tenant_cache(tenant)
 
         await self._publisher.publish_sovereign_model_registered(
             tenant_id=tenant.tenant_id,
-            model_reg_id=uuid.UUID(registration.get("registry_id", str(uuid.uuid4()))),
+            model_reg_id=registration.get("registry_id") or new_entity_id(),
             model_id=model_id,
             jurisdiction=jurisdiction,
-            correlation_id=str(uuid.uuid4()),
+            correlation_id=new_correlation_id(),
         )
 
-        logger.info(
+        self._log.info(
             "Model registered and certified in sovereign registry",
             model_id=model_id,
             model_version=model_version,
@@ -1664,11 +2020,18 @@ class ModelRegistryService:
         Returns:
             List of matching registry entry dicts.
         """
-        return await self._registry.query_registry(
-            jurisdiction=jurisdiction,
-            compliance_tag=compliance_tag,
-            tenant=tenant,
-        )
+
+        async def load() -> list[dict]:
+            return await self._registry.query_registry(
+                jurisdiction=jurisdiction,
+                compliance_tag=compliance_tag,
+                tenant=tenant,
+            )
+
+        if self._cache is None:
+            return await load()
+        key = ("query_registry", tenant.tenant_id, jurisdiction, compliance_tag)
+        return await self._cache.get_or_load(key, load)
 
     async def get_certifications(
         self, model_id: str, jurisdiction: str, tenant: TenantContext
@@ -1683,9 +2046,16 @@ class ModelRegistryService:
         Returns:
             List of certification dicts.
         """
-        return await self._registry.get_certifications(
-            model_id=model_id, jurisdiction=jurisdiction, tenant=tenant
-        )
+
+        async def load() -> list[dict]:
+            return await self._registry.get_certifications(
+                model_id=model_id, jurisdiction=jurisdiction, tenant=tenant
+            )
+
+        if self._cache is None:
+            return await load()
+        key = ("certifications", tenant.tenant_id, model_id, jurisdiction)
+        return await self._cache.get_or_load(key, load)
 
     async def synchronize_registry(
         self, source_jurisdiction: str, tenant: TenantContext
@@ -1699,9 +2069,11 @@ class ModelRegistryService:
         Returns:
             Synchronization result dict with synced_count and conflicts.
         """
-        return await self._registry.synchronize_registry(
+        result = await self._registry.synchronize_registry(
             source_jurisdiction=source_jurisdiction, tenant=tenant
         )
+        self._invalidate_tenant_cache(tenant)
+        return result
 
 
 __all__ = [
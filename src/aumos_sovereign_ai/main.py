@@ -7,11 +7,14 @@ from fastapi import FastAPI
 
 from aumos_common.app import create_app
 from aumos_common.database import init_database
+from aumos_common.observability import get_logger
 
 from aumos_sovereign_ai.api.router import router
-from aumos_sovereign_ai.settings import Settings
+from aumos_sovereign_ai.core.background import drain_background_tasks
+from aumos_sovereign_ai.core.log_events import install_log_event_renderer
+from aumos_sovereign_ai.settings import get_settings
 
-settings = Settings()
+logger = get_logger(__name__)
 
 
 @asynccontextmanager
@@ -24,13 +27,25 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Yields:
         None
     """
+    settings = get_settings()
     # Startup
-    init_database(settings.database)
+    # Without AUMOS_DATABASE__URL (e.g. test runs with lifespan enabled) there is
+    # nothing to connect to, so skip engine creation instead of failing on it.
+    # In-memory SQLite URLs are only used by tests, which build their own
+    # per-test engines; a second app-level engine would be pure overhead.
+    database_url = str(settings.database.url or "")
+    if not database_url:
+        logger.warning("No database URL configured; skipping database initialisation")
+    elif database_url.startswith("sqlite") and ":memory:" in database_url:
+        logger.info("In-memory SQLite database configured; skipping database initialisation")
+    else:
+        init_database(settings.database)
     # TODO: Initialize Kafka publisher for sovereignty events
     # TODO: Initialize K8s client for regional deployments
     # TODO: Initialize Redis client for compliance cache
     yield
     # Shutdown
+    await drain_background_tasks(timeout=10.0)
     # TODO: Close Kafka connections
     # TODO: Close Redis connections
 
@@ -38,7 +53,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 app: FastAPI = create_app(
     service_name="aumos-sovereign-ai",
     version="0.1.0",
-    settings=settings,
+    settings=get_settings(),
     lifespan=lifespan,
     health_checks=[
         # HealthCheck(name="postgres", check_fn=check_db),
@@ -46,4 +61,7 @@ app: FastAPI = create_app(
     ],
 )
 
+# After create_app so the processor joins the chain aumos_common configured.
+install_log_event_renderer()
+
 app.include_router(router, prefix="/api/v1")
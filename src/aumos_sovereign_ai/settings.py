@@ -4,6 +4,8 @@ All standard AumOS configuration is inherited from AumOSSettings.
 Sovereign-AI-specific settings use the AUMOS_SOVEREIGN_ env prefix.
 """
 
+from functools import cached_property, lru_cache
+
 from pydantic_settings import SettingsConfigDict
 
 from aumos_common.config import AumOSSettings
@@ -23,15 +25,15 @@ class Settings(AumOSSettings):
     # Default jurisdiction for fallback routing
     default_jurisdiction: str = "US"
 
-    # Supported regions for deployment
-    supported_regions: list[str] = [
+    # Supported regions for deployment (use supported_regions_set for membership checks)
+    supported_regions: tuple[str, ...] = (
         "us-east-1",
         "us-west-2",
         "eu-west-1",
         "eu-central-1",
         "ap-southeast-1",
         "ap-northeast-1",
-    ]
+    )
 
     # Kubernetes namespace prefix for regional deployments
     k8s_namespace_prefix: str = "aumos-sovereign"
@@ -42,4 +44,34 @@ class Settings(AumOSSettings):
     # Compliance check cache TTL in seconds
     compliance_cache_ttl_seconds: int = 3600
 
-    model_config = SettingsConfigDict(env_prefix="AUMOS_SOVEREIGN_")
+    # Defaults are trusted as written, unknown env keys are ignored and the
+    # instance is immutable once built (it is shared via get_settings()).
+    model_config = SettingsConfigDict(
+        env_prefix="AUMOS_SOVEREIGN_",
+        validate_default=False,
+        extra="ignore",
+        frozen=True,
+        case_sensitive=False,
+    )
+
+    @cached_property
+    def supported_regions_set(self) -> frozenset[str]:
+        """Supported regions as a frozenset for constant-time membership checks.
+
+        Returns:
+            The configured supported regions.
+        """
+        return frozenset(self.supported_regions)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance, parsing the environment once.
+
+    Tests that change environment variables can call ``get_settings.cache_clear()``
+    to force a reload.
+
+    Returns:
+        The cached Settings instance.
+    """
+    return Settings()
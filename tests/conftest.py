@@ -7,16 +7,60 @@ Import standard fixtures from aumos_common.testing:
   - UserFactory, TenantFactory: Factory Boy factories for test data
 
 Override auth for endpoint tests using override_auth_dependency.
+
+Endpoint tests share one session-scoped ``asgi_client``. Modules using it run
+on the session event loop via
+``pytestmark = pytest.mark.asyncio(loop_scope="session")``.
 """
 
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
 import pytest
-from httpx import AsyncClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 
 from aumos_common.auth import get_current_user
 from aumos_common.testing import UserFactory, override_auth_dependency
 
 from aumos_sovereign_ai.main import app
 
+# One transport for the whole run; any additional per-test AsyncClient should
+# reuse it rather than wrapping the app again.
+_TRANSPORT = ASGITransport(app=app)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def asgi_client() -> AsyncIterator[AsyncClient]:
+    """Async HTTP client bound to the app, shared by the whole test session.
+
+    httpx's ASGITransport only forwards HTTP requests and never sends ASGI
+    lifespan events, so the app's startup and shutdown hooks (database
+    initialisation, background task draining) do not run here. Tests that
+    need them should wrap the app in ``asgi_lifespan.LifespanManager``
+    explicitly.
+
+    Yields:
+        HTTPX AsyncClient routed to the FastAPI app in-process.
+    """
+    async with AsyncClient(transport=_TRANSPORT, base_url="http://test") as async_client:
+        yield async_client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def openapi_schema(asgi_client: AsyncClient) -> dict[str, Any]:
+    """OpenAPI schema served by the app, fetched once per test session.
+
+    Args:
+        asgi_client: The session-scoped client.
+
+    Returns:
+        The decoded /openapi.json document.
+    """
+    response = await asgi_client.get("/openapi.json")
+    assert response.status_code == 200
+    return response.json()
+
 
 @pytest.fixture
 def mock_user() -> UserFactory:
@@ -29,16 +73,16 @@ def mock_user() -> UserFactory:
 
 
 @pytest.fixture
-async def client(mock_user: UserFactory) -> AsyncClient:
-    """Async HTTP client with auth overrides applied.
+def client(asgi_client: AsyncClient, mock_user: UserFactory) -> Iterator[AsyncClient]:
+    """Shared async HTTP client with auth overrides applied for one test.
 
     Args:
+        asgi_client: The session-scoped client.
         mock_user: The test user fixture for auth override.
 
-    Returns:
-        Configured HTTPX AsyncClient for test requests.
+    Yields:
+        The shared AsyncClient, with overrides cleared after the test.
     """
     app.dependency_overrides[get_current_user] = override_auth_dependency(mock_user)
-    async with AsyncClient(app=app, base_url="http://test") as async_client:
-        yield async_client
+    yield asgi_client
     app.dependency_overrides.clear()
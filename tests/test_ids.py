@@ -0,0 +1,79 @@
+"""Tests for pooled correlation ID generation."""
+
+import re
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from aumos_sovereign_ai.core import ids
+from aumos_sovereign_ai.core.ids import new_correlation_id, new_entity_id
+
+_HEX_ID = re.compile(r"[0-9a-f]{32}")
+
+
+def test_new_correlation_id_is_32_hex_char_uuid4() -> None:
+    """IDs must be compact lowercase hex encoding an RFC 4122 version-4 UUID."""
+    correlation_id = new_correlation_id()
+
+    assert _HEX_ID.fullmatch(correlation_id)
+    parsed = uuid.UUID(hex=correlation_id)
+    assert parsed.version == 4
+    assert parsed.variant == uuid.RFC_4122
+
+
+def test_ids_are_unique_across_pool_refills(monkeypatch: pytest.MonkeyPatch) -> None:
+    """IDs handed out on both sides of a refill boundary must not repeat."""
+    refills = 0
+    urandom = ids.os.urandom
+
+    def counting_urandom(size: int) -> bytes:
+        nonlocal refills
+        refills += 1
+        return urandom(size)
+
+    monkeypatch.setattr(ids.os, "urandom", counting_urandom)
+    pool = ids._CorrelationIdPool()
+
+    generated = [pool.next_id() for _ in range(ids._IDS_PER_REFILL * 2 + 1)]
+
+    assert refills == 3
+    assert len(set(generated)) == len(generated)
+
+
+def test_refill_does_not_reuse_bytes_from_the_previous_block(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The first ID after a refill must come from the new block, not the exhausted one."""
+    blocks = iter([b"\x00" * ids._ID_BYTES * ids._IDS_PER_REFILL, b"\xff" * ids._ID_BYTES * ids._IDS_PER_REFILL])
+    monkeypatch.setattr(ids.os, "urandom", lambda size: next(blocks))
+    pool = ids._CorrelationIdPool()
+
+    first_block = {pool.next_id() for _ in range(ids._IDS_PER_REFILL)}
+    after_refill = pool.next_id()
+
+    assert after_refill not in first_block
+    assert uuid.UUID(hex=after_refill).version == 4
+
+
+def test_concurrent_callers_never_receive_duplicate_ids() -> None:
+    """Threads drawing from the shared pool at once must all get distinct IDs."""
+    per_worker = ids._IDS_PER_REFILL * 4
+    workers = 8
+
+    def draw(_: int) -> list[str]:
+        return [new_correlation_id() for _ in range(per_worker)]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        batches = list(executor.map(draw, range(workers)))
+
+    generated = [correlation_id for batch in batches for correlation_id in batch]
+    assert len(set(generated)) == workers * per_worker
+
+
+def test_new_entity_id_is_canonical_uuid4_string() -> None:
+    """Entity IDs must keep the dashed form str(uuid.uuid4()) produces."""
+    entity_id = new_entity_id()
+
+    parsed = uuid.UUID(entity_id)
+    assert entity_id == str(parsed)
+    assert parsed.version == 4
+    assert new_entity_id() != entity_id
@@ -0,0 +1,50 @@
+"""Tests for log event code rendering.
+
+Per-request service logs carry ``LogEvent`` codes; these tests verify the
+application wires ``render_log_event`` into structlog so production records
+still show the human-readable message.
+"""
+
+import structlog
+from structlog.processors import KeyValueRenderer
+from structlog.testing import ReturnLogger
+
+from aumos_sovereign_ai.core.log_events import LogEvent, install_log_event_renderer, render_log_event
+from aumos_sovereign_ai.main import app  # noqa: F401  # importing the app installs the renderer
+
+
+def test_app_registers_render_log_event_ahead_of_renderer() -> None:
+    """Importing the app must place render_log_event just before the final processor."""
+    processors = structlog.get_config()["processors"]
+
+    assert render_log_event in processors
+    assert processors.index(render_log_event) == len(processors) - 2
+
+
+def test_install_log_event_renderer_is_idempotent() -> None:
+    """Repeated installs must not add the processor twice."""
+    install_log_event_renderer()
+    install_log_event_renderer()
+
+    assert structlog.get_config()["processors"].count(render_log_event) == 1
+
+
+def test_log_event_is_rendered_as_message_with_code() -> None:
+    """A LogEvent record must render its message and keep the integer code."""
+    log = structlog.wrap_logger(
+        ReturnLogger(),
+        processors=[render_log_event, KeyValueRenderer(key_order=["event", "event_code"])],
+    )
+
+    rendered = log.info(LogEvent.ROUTING_DECISION, jurisdiction="DE")
+
+    assert rendered == "event='Sovereign routing decision' event_code=1001 jurisdiction='DE'"
+
+
+def test_plain_string_event_passes_through_unchanged() -> None:
+    """Records logged with a string message must not gain an event_code."""
+    log = structlog.wrap_logger(ReturnLogger(), processors=[render_log_event, KeyValueRenderer()])
+
+    rendered = log.info("Customer key imported")
+
+    assert rendered == "event='Customer key imported'"
@@ -0,0 +1,86 @@
+"""Tests for the application lifespan.
+
+The lifespan is entered directly with settings and infrastructure hooks
+patched, so no database or broker is needed.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from aumos_sovereign_ai import main
+from aumos_sovereign_ai.core.background import drain_background_tasks, run_in_background
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+def _patch_lifespan_dependencies(monkeypatch: pytest.MonkeyPatch, database_url: str | None) -> SimpleNamespace:
+    """Patch settings and infrastructure calls used by the lifespan.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+        database_url: Database URL the patched settings report.
+
+    Returns:
+        Namespace holding the patched settings and the two mocks.
+    """
+    settings = SimpleNamespace(database=SimpleNamespace(url=database_url))
+    init_database = MagicMock()
+    drain = AsyncMock()
+    monkeypatch.setattr(main, "get_settings", lambda: settings)
+    monkeypatch.setattr(main, "init_database", init_database)
+    monkeypatch.setattr(main, "drain_background_tasks", drain)
+    return SimpleNamespace(settings=settings, init_database=init_database, drain=drain)
+
+
+@pytest.mark.parametrize(
+    "database_url",
+    [None, "", "sqlite+aiosqlite:///:memory:"],
+    ids=["unset", "empty", "in-memory-sqlite"],
+)
+async def test_lifespan_skips_database_init_without_a_real_database(
+    monkeypatch: pytest.MonkeyPatch,
+    database_url: str | None,
+) -> None:
+    """No URL or an in-memory SQLite URL must not create an app-level engine."""
+    patched = _patch_lifespan_dependencies(monkeypatch, database_url)
+
+    async with main.lifespan(main.app):
+        pass
+
+    patched.init_database.assert_not_called()
+
+
+async def test_lifespan_initialises_configured_database(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A real database URL must be passed through to init_database once."""
+    patched = _patch_lifespan_dependencies(monkeypatch, "postgresql+asyncpg://aumos@db:5432/aumos")
+
+    async with main.lifespan(main.app):
+        patched.init_database.assert_called_once_with(patched.settings.database)
+
+
+async def test_lifespan_drains_background_tasks_on_shutdown(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Background tasks must be drained on shutdown, not while serving."""
+    patched = _patch_lifespan_dependencies(monkeypatch, "")
+
+    async with main.lifespan(main.app):
+        patched.drain.assert_not_awaited()
+
+    patched.drain.assert_awaited_once_with(timeout=10.0)
+
+
+async def test_drain_background_tasks_waits_for_scheduled_work() -> None:
+    """Draining must let an in-flight background task run to completion."""
+    finished = asyncio.Event()
+
+    async def publish() -> None:
+        await asyncio.sleep(0.01)
+        finished.set()
+
+    run_in_background(publish(), name="test-publish")
+
+    await drain_background_tasks(timeout=1.0)
+
+    assert finished.is_set()
@@ -4,37 +4,161 @@ Tests use mocked repositories to isolate service logic from the database.
 All mocks implement the Protocol interfaces defined in core/interfaces.py.
 """
 
+import asyncio
+import itertools
 import uuid
+from collections.abc import Awaitable, Callable, Coroutine
 from datetime import UTC, datetime
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from aumos_sovereign_ai.adapters.encryption_key_manager import SovereignKeyManager
 from aumos_sovereign_ai.adapters.kafka import SovereignEventPublisher
+from aumos_sovereign_ai.adapters.regional_deployer import RegionalDeployer
+from aumos_sovereign_ai.core.cache import AsyncTTLCache
+from aumos_sovereign_ai.core.interfaces import IJurisdictionRouter
 from aumos_sovereign_ai.core.models import (
-    ComplianceStatus,
     DeploymentStatus,
     ModelApprovalStatus,
     RegionalDeployment,
+    RegionalDeploymentSnapshot,
     ResidencyAction,
     ResidencyRule,
+    ResidencyRuleSnapshot,
+    RoutingPolicy,
+    RoutingPolicySnapshot,
+    RoutingStrategy,
     SovereignModel,
 )
 from aumos_sovereign_ai.core.services import (
     GeopatriationService,
+    JurisdictionRouterService,
+    KeyManagementService,
+    ModelRegistryService,
     RegionalDeployerService,
     SovereignRegistryService,
+    SovereignRoutingService,
 )
 
+_TEST_TENANT_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+# Frozen so factory output is deterministic; no test depends on wall-clock time.
+_TEST_NOW = datetime(2024, 1, 1, tzinfo=UTC)
 
-def _make_tenant() -> MagicMock:
-    """Create a mock TenantContext.
+_fake_uuid_counter = itertools.count(1)
+
+
+def _fake_uuid() -> uuid.UUID:
+    """Return a unique, deterministic UUID for test doubles.
+
+    Returns:
+        A UUID built from a module-level counter.
+    """
+    return uuid.UUID(int=next(_fake_uuid_counter))
+
+
+# Built once: specing SovereignEventPublisher walks the class on every
+# construction. copy.copy() of a mock shares its child mocks between copies,
+# so tests reuse this instance and reset it instead. spec_set also rejects
+# assignments to attributes the publisher does not define.
+_PUBLISHER_TEMPLATE = AsyncMock(spec_set=SovereignEventPublisher)
+
+
+class _StubMethod:
+    """Awaitable stand-in for one repository method, recording its calls."""
+
+    __slots__ = ("call_args_list", "return_value", "side_effect")
+
+    def __init__(self) -> None:
+        self.call_args_list: list[tuple[tuple[object, ...], dict[str, object]]] = []
+        self.return_value: object = None
+        self.side_effect: Callable[..., Awaitable[object]] | None = None
+
+    def __call__(self, *args: object, **kwargs: object) -> Coroutine[object, object, object]:
+        # Recorded at call time, like AsyncMock, so scheduled-but-unawaited calls count.
+        self.call_args_list.append((args, kwargs))
+        return self._result(args, kwargs)
+
+    async def _result(self, args: tuple[object, ...], kwargs: dict[str, object]) -> object:
+        if self.side_effect is not None:
+            return await self.side_effect(*args, **kwargs)
+        return self.return_value
+
+    @property
+    def call_count(self) -> int:
+        """Number of recorded calls."""
+        return len(self.call_args_list)
+
+    def assert_called_once(self) -> None:
+        """Assert the method was called exactly once."""
+        assert self.call_count == 1, f"Expected 1 call, got {self.call_count}"
+
+    def assert_called_once_with(self, *args: object, **kwargs: object) -> None:
+        """Assert the method was called exactly once, with these arguments."""
+        assert self.call_args_list == [(args, kwargs)], (
+            f"Expected one call with {(args, kwargs)}, got {self.call_args_list}"
+        )
+
+    def assert_not_called(self) -> None:
+        """Assert the method was never called."""
+        assert not self.call_args_list, f"Expected no calls, got {self.call_args_list}"
+
+
+class AsyncStub:
+    """Lightweight async repository double.
+
+    Any public attribute is an awaitable method returning its configured
+    ``return_value`` (None by default), or awaiting ``side_effect`` when one
+    is set, and recording its calls. Supports the
+    subset of the AsyncMock API these tests use, at a fraction of the cost.
+    """
+
+    def __init__(self) -> None:
+        self._methods: dict[str, _StubMethod] = {}
+
+    def __getattr__(self, name: str) -> _StubMethod:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        method = self._methods.get(name)
+        if method is None:
+            method = self._methods[name] = _StubMethod()
+        return method
+
+    def reset_mock(self, **_: object) -> None:
+        """Forget all recorded calls and configured return values."""
+        self._methods.clear()
+
+
+def _reset_mocks(*mocks: AsyncMock | AsyncStub) -> None:
+    """Reset session-scoped mocks, including configured return values and side effects.
+
+    Args:
+        mocks: Mocks to reset.
+    """
+    for mock in mocks:
+        mock.reset_mock(return_value=True, side_effect=True)
+
+
+def _fresh_publisher() -> AsyncMock:
+    """Return the shared publisher mock with all recorded state cleared.
+
+    Returns:
+        The spec'd SovereignEventPublisher mock.
+    """
+    _reset_mocks(_PUBLISHER_TEMPLATE)
+    return _PUBLISHER_TEMPLATE
+
+
+@pytest.fixture(scope="session")
+def tenant() -> MagicMock:
+    """Return a mock TenantContext shared by every test; tests must not mutate it.
 
     Returns:
         A mock TenantContext with a fixed tenant_id.
     """
     tenant = MagicMock()
-    tenant.tenant_id = uuid.UUID("00000000-0000-0000-0000-000000000001")
+    tenant.tenant_id = _TEST_TENANT_ID
     return tenant
 
 
@@ -46,7 +170,7 @@ def _make_residency_rule(
     action: ResidencyAction = ResidencyAction.BLOCK,
     priority: int = 100,
 ) -> ResidencyRule:
-    """Build a mock ResidencyRule with sensible defaults.
+    """Build a stand-in ResidencyRule with sensible defaults.
 
     Args:
         jurisdiction: Jurisdiction the rule applies to.
@@ -57,18 +181,22 @@ def _make_residency_rule(
         priority: Rule evaluation priority.
 
     Returns:
-        A ResidencyRule-like MagicMock.
+        A ResidencyRule-like SimpleNamespace.
     """
-    rule = MagicMock(spec=ResidencyRule)
-    rule.id = uuid.uuid4()
-    rule.jurisdiction = jurisdiction
-    rule.data_classification = "all"
-    rule.allowed_regions = allowed_regions or ["eu-west-1", "eu-central-1"]
-    rule.blocked_regions = blocked_regions or []
-    rule.is_active = is_active
-    rule.action_on_violation = action
-    rule.priority = priority
-    return rule
+    allowed_regions = allowed_regions or ["eu-west-1", "eu-central-1"]
+    blocked_regions = blocked_regions or []
+    return SimpleNamespace(
+        id=_fake_uuid(),
+        jurisdiction=jurisdiction,
+        data_classification="all",
+        allowed_regions=allowed_regions,
+        blocked_regions=blocked_regions,
+        allowed_region_set=frozenset(allowed_regions),
+        blocked_region_set=frozenset(blocked_regions),
+        is_active=is_active,
+        action_on_violation=action,
+        priority=priority,
+    )
 
 
 def _make_deployment(
@@ -77,7 +205,7 @@ def _make_deployment(
     status: DeploymentStatus = DeploymentStatus.ACTIVE,
     endpoint_url: str = "https://eu-west-1.sovereign.aumos.io",
 ) -> RegionalDeployment:
-    """Build a mock RegionalDeployment.
+    """Build a stand-in RegionalDeployment.
 
     Args:
         region: Cloud region.
@@ -86,23 +214,55 @@ def _make_deployment(
         endpoint_url: Active endpoint URL.
 
     Returns:
-        A RegionalDeployment-like MagicMock.
+        A RegionalDeployment-like SimpleNamespace.
     """
-    deployment = MagicMock(spec=RegionalDeployment)
-    deployment.id = uuid.uuid4()
-    deployment.tenant_id = uuid.UUID("00000000-0000-0000-0000-000000000001")
-    deployment.region = region
-    deployment.jurisdiction = jurisdiction
-    deployment.cluster_name = f"aumos-{region}"
-    deployment.namespace = "aumos-sovereign"
-    deployment.status = status
-    deployment.endpoint_url = endpoint_url
-    deployment.resource_config = {}
-    deployment.deployment_manifest = {}
-    deployment.error_message = None
-    deployment.created_at = datetime.now(UTC)
-    deployment.updated_at = datetime.now(UTC)
-    return deployment
+    return SimpleNamespace(
+        id=_fake_uuid(),
+        tenant_id=_TEST_TENANT_ID,
+        region=region,
+        jurisdiction=jurisdiction,
+        cluster_name=f"aumos-{region}",
+        namespace="aumos-sovereign",
+        status=status,
+        endpoint_url=endpoint_url,
+        resource_config={},
+        deployment_manifest={},
+        error_message=None,
+        created_at=_TEST_NOW,
+        updated_at=_TEST_NOW,
+    )
+
+
+def _make_routing_policy(
+    target_deployment_id: uuid.UUID | None,
+    fallback_deployment_id: uuid.UUID | None = None,
+    strategy: RoutingStrategy = RoutingStrategy.PREFERRED,
+    priority: int = 100,
+) -> RoutingPolicy:
+    """Build a stand-in RoutingPolicy.
+
+    Args:
+        target_deployment_id: Primary deployment the policy routes to.
+        fallback_deployment_id: Optional fallback deployment.
+        strategy: Routing strategy.
+        priority: Policy evaluation priority.
+
+    Returns:
+        A RoutingPolicy-like SimpleNamespace.
+    """
+    return SimpleNamespace(
+        id=_fake_uuid(),
+        source_jurisdiction="DE",
+        target_deployment_id=str(target_deployment_id) if target_deployment_id else None,
+        fallback_deployment_id=str(fallback_deployment_id) if fallback_deployment_id else None,
+        target_deployment_uuid=target_deployment_id,
+        fallback_deployment_uuid=fallback_deployment_id,
+        allowed_model_ids=[],
+        allowed_model_id_set=frozenset(),
+        strategy=strategy,
+        is_active=True,
+        priority=priority,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -113,22 +273,28 @@ def _make_deployment(
 class TestGeopatriationService:
     """Tests for GeopatriationService residency enforcement logic."""
 
-    @pytest.fixture
-    def mock_repo(self) -> AsyncMock:
-        """Create a mock IResidencyRuleRepository."""
-        return AsyncMock()
+    pytestmark = pytest.mark.asyncio
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
+    def mock_repo(self) -> AsyncStub:
+        """Create a mock IResidencyRuleRepository, shared across the session."""
+        return AsyncStub()
+
+    @pytest.fixture(scope="session")
     def mock_publisher(self) -> AsyncMock:
-        """Create a mock SovereignEventPublisher."""
-        publisher = AsyncMock(spec=SovereignEventPublisher)
-        return publisher
+        """Return the shared spec'd SovereignEventPublisher mock."""
+        return _PUBLISHER_TEMPLATE
 
-    @pytest.fixture
+    @pytest.fixture(autouse=True)
+    def _fresh_mocks(self, mock_repo: AsyncStub, mock_publisher: AsyncMock) -> None:
+        """Clear calls and results left by the previous test on the class-wide service's mocks."""
+        _reset_mocks(mock_repo, mock_publisher)
+
+    @pytest.fixture(scope="class")
     def service(
-        self, mock_repo: AsyncMock, mock_publisher: AsyncMock
+        self, mock_repo: AsyncStub, mock_publisher: AsyncMock
     ) -> GeopatriationService:
-        """Create GeopatriationService with mocked dependencies.
+        """Create GeopatriationService with mocked dependencies, once per class.
 
         Args:
             mock_repo: Mocked residency rule repository.
@@ -142,187 +308,243 @@ class TestGeopatriationService:
             publisher=mock_publisher,
         )
 
-    @pytest.mark.asyncio
-    async def test_enforce_residency_compliant_region(
+    @pytest.mark.parametrize(
+        ("rule_kwargs", "jurisdiction", "data_region", "data_classification", "expected_action"),
+        [
+            pytest.param(
+                [{"jurisdiction": "DE", "allowed_regions": ["eu-west-1", "eu-central-1"]}],
+                "DE", "eu-west-1", "pii", None,
+                id="compliant-region",
+            ),
+            pytest.param(
+                [{
+                    "jurisdiction": "DE",
+                    "allowed_regions": ["eu-west-1"],
+                    "blocked_regions": ["us-east-1"],
+                    "action": ResidencyAction.BLOCK,
+                }],
+                "DE", "us-east-1", "all", "block",
+                id="blocked-region",
+            ),
+            pytest.param(
+                [{"jurisdiction": "EU", "allowed_regions": ["eu-west-1", "eu-central-1"], "blocked_regions": []}],
+                "EU", "ap-southeast-1", "all", "block",
+                id="region-not-in-allowed",
+            ),
+            # Also covers inactive rules: the repository query excludes them,
+            # so a jurisdiction with only inactive rules yields no rules here.
+            pytest.param([], "AU", "ap-southeast-2", "all", None, id="no-active-rules"),
+        ],
+    )
+    async def test_enforce_residency(
         self,
         service: GeopatriationService,
-        mock_repo: AsyncMock,
+        mock_repo: AsyncStub,
         mock_publisher: AsyncMock,
+        rule_kwargs: list[dict],
+        jurisdiction: str,
+        data_region: str,
+        data_classification: str,
+        expected_action: str | None,
+        tenant: MagicMock,
     ) -> None:
-        """Compliant data region should return compliant=True with no violations.
+        """Enforcement must flag exactly the first violating active rule.
 
-        When data resides in an allowed region, enforcement must succeed
-        and no Kafka event should be published.
+        A blocked region, or a region outside a non-empty allowed list,
+        violates the rule and publishes a ResidencyViolation event. Compliant
+        regions and jurisdictions without active rules publish nothing. Rules
+        are only loaded through the active, classification-scoped lookup.
         """
-        tenant = _make_tenant()
-        rule = _make_residency_rule(
-            jurisdiction="DE",
-            allowed_regions=["eu-west-1", "eu-central-1"],
-        )
-        mock_repo.list_by_jurisdiction.return_value = [rule]
+        mock_repo.list_active_by_jurisdiction_and_classification.return_value = [
+            _make_residency_rule(**kwargs) for kwargs in rule_kwargs
+        ]
 
         result = await service.enforce_residency(
-            jurisdiction="DE",
-            data_region="eu-west-1",
-            data_classification="pii",
+            jurisdiction=jurisdiction,
+            data_region=data_region,
+            data_classification=data_classification,
             tenant=tenant,
         )
 
-        assert result["compliant"] is True
-        assert result["violated_rules"] == []
-        assert result["required_action"] is None
-        mock_publisher.publish_residency_violation.assert_not_called()
+        expected_compliant = expected_action is None
+        assert result["compliant"] is expected_compliant
+        assert len(result["violated_rules"]) == (0 if expected_compliant else 1)
+        assert result["required_action"] == expected_action
+        assert mock_publisher.publish_residency_violation.call_count == (0 if expected_compliant else 1)
+        mock_repo.list_active_by_jurisdiction_and_classification.assert_called_once_with(
+            jurisdiction, data_classification, tenant
+        )
+        mock_repo.list_by_jurisdiction.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_enforce_residency_blocked_region(
+    async def test_create_residency_rule_publishes_event(
         self,
         service: GeopatriationService,
-        mock_repo: AsyncMock,
+        mock_repo: AsyncStub,
         mock_publisher: AsyncMock,
+        tenant: MagicMock,
     ) -> None:
-        """Data in a blocked region must return compliant=False and publish event.
+        """Creating a residency rule must publish a ResidencyRuleCreated event.
 
-        When data is in a blocked region, enforcement must fail and
-        a ResidencyViolation event must be published to Kafka.
+        Verifies that the service coordinates repository creation and
+        Kafka event publication after creating a rule.
         """
-        tenant = _make_tenant()
-        rule = _make_residency_rule(
-            jurisdiction="DE",
-            allowed_regions=["eu-west-1"],
-            blocked_regions=["us-east-1"],
-            action=ResidencyAction.BLOCK,
-        )
-        mock_repo.list_by_jurisdiction.return_value = [rule]
+        created_rule = _make_residency_rule(jurisdiction="JP")
+        mock_repo.create.return_value = created_rule
 
-        result = await service.enforce_residency(
-            jurisdiction="DE",
-            data_region="us-east-1",
-            data_classification="all",
+        result = await service.create_residency_rule(
+            jurisdiction="JP",
+            data_classification="pii",
+            allowed_regions=["ap-northeast-1"],
+            blocked_regions=[],
             tenant=tenant,
         )
 
-        assert result["compliant"] is False
-        assert len(result["violated_rules"]) == 1
-        assert result["required_action"] == "block"
-        mock_publisher.publish_residency_violation.assert_called_once()
+        mock_repo.create.assert_called_once_with(
+            jurisdiction="JP",
+            data_classification="pii",
+            allowed_regions=["ap-northeast-1"],
+            blocked_regions=[],
+            tenant=tenant,
+        )
+        mock_publisher.publish_residency_rule_created.assert_called_once()
+        assert result == created_rule
 
-    @pytest.mark.asyncio
-    async def test_enforce_residency_region_not_in_allowed(
+    async def test_create_residency_rule_invalidates_cached_rules(
         self,
-        service: GeopatriationService,
-        mock_repo: AsyncMock,
+        mock_repo: AsyncStub,
         mock_publisher: AsyncMock,
+        tenant: MagicMock,
     ) -> None:
-        """Region not in allowed list must return compliant=False.
-
-        When allowed_regions is specified and data_region is absent from it,
-        the rule is violated even without an explicit block.
-        """
-        tenant = _make_tenant()
-        rule = _make_residency_rule(
-            jurisdiction="EU",
-            allowed_regions=["eu-west-1", "eu-central-1"],
-            blocked_regions=[],
+        """Creating a rule must drop the cached rule status for its jurisdiction."""
+        service = GeopatriationService(
+            residency_repo=mock_repo,
+            publisher=mock_publisher,
+            rule_cache=AsyncTTLCache(maxsize=16, ttl_seconds=60),
+            status_cache=AsyncTTLCache(maxsize=16, ttl_seconds=60),
         )
-        mock_repo.list_by_jurisdiction.return_value = [rule]
+        mock_repo.count_and_list_active.return_value = (1, [_make_residency_rule()])
+        mock_repo.create.return_value = _make_residency_rule()
 
-        result = await service.enforce_residency(
-            jurisdiction="EU",
-            data_region="ap-southeast-1",
-            data_classification="all",
+        await service.get_residency_status(jurisdiction="DE", tenant=tenant)
+        await service.get_residency_status(jurisdiction="DE", tenant=tenant)
+        assert mock_repo.count_and_list_active.call_count == 1
+
+        await service.create_residency_rule(
+            jurisdiction="DE",
+            data_classification="pii",
+            allowed_regions=["eu-west-1"],
+            blocked_regions=[],
             tenant=tenant,
         )
+        await service.get_residency_status(jurisdiction="DE", tenant=tenant)
+        assert mock_repo.count_and_list_active.call_count == 2
 
-        assert result["compliant"] is False
-        assert len(result["violated_rules"]) == 1
-
-    @pytest.mark.asyncio
-    async def test_enforce_residency_no_rules_is_compliant(
+    async def test_create_residency_rule_invalidates_only_after_commit(
         self,
-        service: GeopatriationService,
-        mock_repo: AsyncMock,
+        mock_repo: AsyncStub,
         mock_publisher: AsyncMock,
+        tenant: MagicMock,
     ) -> None:
-        """No active rules should allow any region (compliant by default).
-
-        When no residency rules are defined for a jurisdiction, all regions
-        are implicitly allowed.
-        """
-        tenant = _make_tenant()
-        mock_repo.list_by_jurisdiction.return_value = []
+        """A load between create and commit must not pin the pre-commit rules in the cache."""
+        pending_commit: list[Callable[[], object]] = []
+        service = GeopatriationService(
+            residency_repo=mock_repo,
+            publisher=mock_publisher,
+            rule_cache=AsyncTTLCache(maxsize=16, ttl_seconds=60),
+            after_commit=pending_commit.append,
+        )
+        permissive = _make_residency_rule(allowed_regions=["eu-west-1", "us-east-1"])
+        blocking = _make_residency_rule(blocked_regions=["us-east-1"])
+        mock_repo.list_active_by_jurisdiction_and_classification.return_value = [permissive]
+        mock_repo.create.return_value = blocking
 
-        result = await service.enforce_residency(
-            jurisdiction="AU",
-            data_region="ap-southeast-2",
-            data_classification="all",
+        await service.create_residency_rule(
+            jurisdiction="DE",
+            data_classification="pii",
+            allowed_regions=[],
+            blocked_regions=["us-east-1"],
             tenant=tenant,
         )
+        # A concurrent request still sees the committed rows and caches them.
+        before_commit = await service.enforce_residency(
+            jurisdiction="DE", data_region="us-east-1", data_classification="pii", tenant=tenant
+        )
+        mock_repo.list_active_by_jurisdiction_and_classification.return_value = [blocking, permissive]
+        for callback in pending_commit:
+            callback()
+        after_commit = await service.enforce_residency(
+            jurisdiction="DE", data_region="us-east-1", data_classification="pii", tenant=tenant
+        )
 
-        assert result["compliant"] is True
-        mock_publisher.publish_residency_violation.assert_not_called()
+        assert before_commit["compliant"] is True
+        assert after_commit["compliant"] is False
+        assert mock_repo.list_active_by_jurisdiction_and_classification.call_count == 2
 
-    @pytest.mark.asyncio
-    async def test_enforce_residency_inactive_rules_ignored(
+    async def test_load_overlapping_commit_is_not_cached(
         self,
-        service: GeopatriationService,
-        mock_repo: AsyncMock,
+        mock_repo: AsyncStub,
         mock_publisher: AsyncMock,
+        tenant: MagicMock,
     ) -> None:
-        """Inactive rules must not affect enforcement decisions.
-
-        An inactive rule blocking a region should have no effect on
-        the enforcement result.
-        """
-        tenant = _make_tenant()
-        inactive_rule = _make_residency_rule(
-            jurisdiction="FR",
-            blocked_regions=["us-east-1"],
-            is_active=False,
+        """Rules read before an invalidation but returned after it must not be cached."""
+        cache = AsyncTTLCache(maxsize=16, ttl_seconds=60)
+        service = GeopatriationService(residency_repo=mock_repo, publisher=mock_publisher, rule_cache=cache)
+        permissive = _make_residency_rule(allowed_regions=["eu-west-1", "us-east-1"])
+        mock_repo.create.return_value = _make_residency_rule(blocked_regions=["us-east-1"])
+        load_started = asyncio.Event()
+        release_load = asyncio.Event()
+
+        async def slow_load(*_args: object) -> list[ResidencyRule]:
+            load_started.set()
+            await release_load.wait()
+            return [permissive]
+
+        mock_repo.list_active_by_jurisdiction_and_classification.side_effect = slow_load
+        in_flight = asyncio.create_task(
+            service.enforce_residency(
+                jurisdiction="DE", data_region="us-east-1", data_classification="pii", tenant=tenant
+            )
         )
-        mock_repo.list_by_jurisdiction.return_value = [inactive_rule]
-
-        result = await service.enforce_residency(
-            jurisdiction="FR",
-            data_region="us-east-1",
-            data_classification="all",
+        await load_started.wait()
+        await service.create_residency_rule(
+            jurisdiction="DE",
+            data_classification="pii",
+            allowed_regions=[],
+            blocked_regions=["us-east-1"],
             tenant=tenant,
         )
+        release_load.set()
+        await in_flight
 
-        assert result["compliant"] is True
+        assert cache.get(("residency_rules", tenant.tenant_id, "DE", "pii")) is None
 
-    @pytest.mark.asyncio
-    async def test_create_residency_rule_publishes_event(
+    async def test_rule_cache_holds_snapshots_detached_from_loaded_rows(
         self,
-        service: GeopatriationService,
-        mock_repo: AsyncMock,
+        mock_repo: AsyncStub,
         mock_publisher: AsyncMock,
+        tenant: MagicMock,
     ) -> None:
-        """Creating a residency rule must publish a ResidencyRuleCreated event.
-
-        Verifies that the service coordinates repository creation and
-        Kafka event publication after creating a rule.
-        """
-        tenant = _make_tenant()
-        created_rule = _make_residency_rule(jurisdiction="JP")
-        mock_repo.create.return_value = created_rule
-
-        result = await service.create_residency_rule(
-            jurisdiction="JP",
-            data_classification="pii",
-            allowed_regions=["ap-northeast-1"],
-            blocked_regions=[],
-            tenant=tenant,
+        """Cached rules must be immutable snapshots unaffected by later changes to the loaded row."""
+        cache = AsyncTTLCache(maxsize=16, ttl_seconds=60)
+        service = GeopatriationService(residency_repo=mock_repo, publisher=mock_publisher, rule_cache=cache)
+        rule = _make_residency_rule(allowed_regions=["eu-west-1"])
+        mock_repo.list_active_by_jurisdiction_and_classification.return_value = [rule]
+
+        first = await service.enforce_residency(
+            jurisdiction="DE", data_region="eu-west-1", data_classification="pii", tenant=tenant
         )
-
-        mock_repo.create.assert_called_once_with(
-            jurisdiction="JP",
-            data_classification="pii",
-            allowed_regions=["ap-northeast-1"],
-            blocked_regions=[],
-            tenant=tenant,
+        # Stands in for the row being changed or expired after its session ends.
+        rule.allowed_region_set = frozenset({"us-east-1"})
+        second = await service.enforce_residency(
+            jurisdiction="DE", data_region="eu-west-1", data_classification="pii", tenant=tenant
         )
-        mock_publisher.publish_residency_rule_created.assert_called_once()
-        assert result == created_rule
+
+        assert first["compliant"] is True
+        assert second["compliant"] is True
+        mock_repo.list_active_by_jurisdiction_and_classification.assert_called_once()
+        (cached_rule,) = cache.get(("residency_rules", tenant.tenant_id, "DE", "pii"))
+        assert isinstance(cached_rule, ResidencyRuleSnapshot)
+        assert cached_rule.allowed_region_set == frozenset({"eu-west-1"})
 
 
 # ---------------------------------------------------------------------------
@@ -333,21 +555,28 @@ class TestGeopatriationService:
 class TestRegionalDeployerService:
     """Tests for RegionalDeployerService deployment management logic."""
 
-    @pytest.fixture
-    def mock_repo(self) -> AsyncMock:
-        """Create a mock IRegionalDeploymentRepository."""
-        return AsyncMock()
+    pytestmark = pytest.mark.asyncio
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
+    def mock_repo(self) -> AsyncStub:
+        """Create a mock IRegionalDeploymentRepository, shared across the session."""
+        return AsyncStub()
+
+    @pytest.fixture(scope="session")
     def mock_publisher(self) -> AsyncMock:
-        """Create a mock SovereignEventPublisher."""
-        return AsyncMock(spec=SovereignEventPublisher)
+        """Return the shared spec'd SovereignEventPublisher mock."""
+        return _PUBLISHER_TEMPLATE
 
-    @pytest.fixture
+    @pytest.fixture(autouse=True)
+    def _fresh_mocks(self, mock_repo: AsyncStub, mock_publisher: AsyncMock) -> None:
+        """Clear calls and results left by the previous test on the class-wide service's mocks."""
+        _reset_mocks(mock_repo, mock_publisher)
+
+    @pytest.fixture(scope="class")
     def service(
-        self, mock_repo: AsyncMock, mock_publisher: AsyncMock
+        self, mock_repo: AsyncStub, mock_publisher: AsyncMock
     ) -> RegionalDeployerService:
-        """Create RegionalDeployerService with mocked dependencies.
+        """Create RegionalDeployerService with mocked dependencies, once per class.
 
         Args:
             mock_repo: Mocked regional deployment repository.
@@ -361,19 +590,18 @@ class TestRegionalDeployerService:
             publisher=mock_publisher,
         )
 
-    @pytest.mark.asyncio
     async def test_deploy_to_region_creates_deployment_and_publishes_event(
         self,
         service: RegionalDeployerService,
-        mock_repo: AsyncMock,
+        mock_repo: AsyncStub,
         mock_publisher: AsyncMock,
+        tenant: MagicMock,
     ) -> None:
         """deploy_to_region must create a deployment record and publish event.
 
         Verifies repository creation is called with correct arguments
         and a DeploymentInitiated event is published.
         """
-        tenant = _make_tenant()
         deployment = _make_deployment(status=DeploymentStatus.PENDING)
         mock_repo.create.return_value = deployment
 
@@ -390,12 +618,12 @@ class TestRegionalDeployerService:
         mock_publisher.publish_deployment_initiated.assert_called_once()
         assert result == deployment
 
-    @pytest.mark.asyncio
     async def test_list_regions_returns_all_deployments(
         self,
         service: RegionalDeployerService,
-        mock_repo: AsyncMock,
+        mock_repo: AsyncStub,
         mock_publisher: AsyncMock,
+        tenant: MagicMock,
     ) -> None:
         """list_regions must return all deployments from the repository.
 
@@ -404,7 +632,6 @@ class TestRegionalDeployerService:
             mock_repo: Mocked repository.
             mock_publisher: Mocked publisher.
         """
-        tenant = _make_tenant()
         deployments = [
             _make_deployment(region="eu-west-1"),
             _make_deployment(region="us-east-1"),
@@ -417,6 +644,155 @@ class TestRegionalDeployerService:
         mock_repo.list_all.assert_called_once_with(tenant)
 
 
+class TestJurisdictionRouterService:
+    """Tests for JurisdictionRouterService policy evaluation."""
+
+    pytestmark = pytest.mark.asyncio
+
+    @pytest.fixture
+    def mock_routing_repo(self) -> AsyncStub:
+        """Create a mock IRoutingPolicyRepository."""
+        return AsyncStub()
+
+    @pytest.fixture
+    def mock_deployment_repo(self) -> AsyncStub:
+        """Create a mock IRegionalDeploymentRepository."""
+        return AsyncStub()
+
+    @pytest.fixture
+    def service(
+        self, mock_routing_repo: AsyncStub, mock_deployment_repo: AsyncStub
+    ) -> JurisdictionRouterService:
+        """Create JurisdictionRouterService with mocked dependencies."""
+        return JurisdictionRouterService(
+            routing_repo=mock_routing_repo,
+            deployment_repo=mock_deployment_repo,
+            publisher=_fresh_publisher(),
+        )
+
+    async def test_route_by_jurisdiction_resolves_deployments_in_one_batch(
+        self,
+        service: JurisdictionRouterService,
+        mock_routing_repo: AsyncStub,
+        mock_deployment_repo: AsyncStub,
+        tenant: MagicMock,
+    ) -> None:
+        """All candidate deployments must be fetched with a single list_by_ids call.
+
+        The first policy's target is failed and it has no usable fallback, so
+        the second policy's active target wins.
+        """
+        failed = _make_deployment(status=DeploymentStatus.FAILED)
+        active = _make_deployment(region="eu-central-1")
+        mock_routing_repo.list_active_by_jurisdiction.return_value = [
+            _make_routing_policy(failed.id, strategy=RoutingStrategy.STRICT, priority=10),
+            _make_routing_policy(active.id, priority=20),
+        ]
+        mock_deployment_repo.list_by_ids.return_value = {failed.id: failed, active.id: active}
+
+        result = await service.route_by_jurisdiction(
+            jurisdiction="DE", model_id="llama-3-8b", tenant=tenant
+        )
+
+        mock_deployment_repo.list_by_ids.assert_called_once()
+        mock_deployment_repo.get_by_id.assert_not_called()
+        assert result["deployment_id"] == str(active.id)
+        assert result["region"] == "eu-central-1"
+
+    async def test_caches_hold_snapshots_detached_from_loaded_rows(
+        self,
+        mock_routing_repo: AsyncStub,
+        mock_deployment_repo: AsyncStub,
+        tenant: MagicMock,
+    ) -> None:
+        """Cached policies and deployments must be snapshots, not the rows the repositories returned."""
+        policy_cache = AsyncTTLCache(maxsize=16, ttl_seconds=60)
+        deployment_cache = AsyncTTLCache(maxsize=16, ttl_seconds=60)
+        service = JurisdictionRouterService(
+            routing_repo=mock_routing_repo,
+            deployment_repo=mock_deployment_repo,
+            publisher=_fresh_publisher(),
+            policy_cache=policy_cache,
+            deployment_cache=deployment_cache,
+        )
+        active = _make_deployment(region="eu-central-1")
+        mock_routing_repo.list_active_by_jurisdiction.return_value = [_make_routing_policy(active.id)]
+        mock_deployment_repo.list_by_ids.return_value = {active.id: active}
+
+        await service.route_by_jurisdiction(jurisdiction="DE", model_id="llama-3-8b", tenant=tenant)
+        # Stands in for the row being changed or expired after its session ends.
+        active.region = "us-east-1"
+        result = await service.route_by_jurisdiction(jurisdiction="DE", model_id="llama-3-8b", tenant=tenant)
+
+        assert result["region"] == "eu-central-1"
+        mock_routing_repo.list_active_by_jurisdiction.assert_called_once()
+        mock_deployment_repo.list_by_ids.assert_called_once()
+        (cached_policy,) = policy_cache.get(("routing_policies", tenant.tenant_id, "DE"))
+        assert isinstance(cached_policy, RoutingPolicySnapshot)
+        assert isinstance(deployment_cache.get(("deployment", tenant.tenant_id, active.id)), RegionalDeploymentSnapshot)
+
+
+class TestSovereignRoutingService:
+    """Tests for SovereignRoutingService detection plus routing."""
+
+    pytestmark = pytest.mark.asyncio
+
+    @pytest.fixture
+    def mock_router(self) -> AsyncMock:
+        """Create a mock IJurisdictionRouter whose rule evaluation never routes."""
+        router = AsyncMock(spec_set=IJurisdictionRouter)
+        router.detect_request_origin.return_value = {
+            "jurisdiction": "DE",
+            "detection_source": "jwt_claim",
+            "confidence": "high",
+            "is_default": False,
+        }
+        router.evaluate_routing_rules.return_value = {
+            "jurisdiction": "DE",
+            "model_id": "llama-3-8b",
+            "selected_region": "eu-central-1",
+            "candidate_regions": ["eu-central-1", "eu-west-1"],
+            "eligible_regions": ["eu-central-1", "eu-west-1"],
+            "excluded_regions": [],
+            "rule_applied": "jurisdiction_priority_DE",
+        }
+        router.apply_fallback_routing.return_value = {
+            "jurisdiction": "DE",
+            "failed_region": "eu-central-1",
+            "fallback_region": "eu-west-1",
+            "model_id": "llama-3-8b",
+            "is_cross_jurisdiction": False,
+            "fallback_applied_at": "2024-01-01T00:00:00+00:00",
+        }
+        return router
+
+    async def test_detect_and_route_fallback_keeps_fallback_region_and_fields(
+        self,
+        mock_router: AsyncMock,
+        tenant: MagicMock,
+    ) -> None:
+        """A fallback route must target fallback_region and keep the adapter's fallback fields."""
+        service = SovereignRoutingService(
+            router=mock_router,
+            regional_deployer=AsyncMock(),
+            publisher=_fresh_publisher(),
+        )
+
+        decision = await service.detect_and_route("llama-3-8b", tenant=tenant)
+
+        mock_router.apply_fallback_routing.assert_called_once()
+        assert decision.selected_region == "eu-west-1"
+        assert decision.fallback_region == "eu-west-1"
+        assert decision.failed_region == "eu-central-1"
+        assert decision.is_cross_jurisdiction is False
+        assert decision.fallback_applied_at == "2024-01-01T00:00:00+00:00"
+        assert decision.confidence == "high"
+        assert decision.detection_source == "jwt_claim"
+        assert decision.is_default is False
+        assert decision.routed is False
+        assert mock_router.log_routing_decision.call_args.kwargs["selected_region"] == "eu-west-1"
+
+
 # ---------------------------------------------------------------------------
 # SovereignRegistryService Tests
 # ---------------------------------------------------------------------------
@@ -425,21 +801,28 @@ class TestRegionalDeployerService:
 class TestSovereignRegistryService:
     """Tests for SovereignRegistryService model registry logic."""
 
-    @pytest.fixture
-    def mock_repo(self) -> AsyncMock:
-        """Create a mock ISovereignModelRepository."""
-        return AsyncMock()
+    pytestmark = pytest.mark.asyncio
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
+    def mock_repo(self) -> AsyncStub:
+        """Create a mock ISovereignModelRepository, shared across the session."""
+        return AsyncStub()
+
+    @pytest.fixture(scope="session")
     def mock_publisher(self) -> AsyncMock:
-        """Create a mock SovereignEventPublisher."""
-        return AsyncMock(spec=SovereignEventPublisher)
+        """Return the shared spec'd SovereignEventPublisher mock."""
+        return _PUBLISHER_TEMPLATE
 
-    @pytest.fixture
+    @pytest.fixture(autouse=True)
+    def _fresh_mocks(self, mock_repo: AsyncStub, mock_publisher: AsyncMock) -> None:
+        """Clear calls and results left by the previous test on the class-wide service's mocks."""
+        _reset_mocks(mock_repo, mock_publisher)
+
+    @pytest.fixture(scope="class")
     def service(
-        self, mock_repo: AsyncMock, mock_publisher: AsyncMock
+        self, mock_repo: AsyncStub, mock_publisher: AsyncMock
     ) -> SovereignRegistryService:
-        """Create SovereignRegistryService with mocked dependencies.
+        """Create SovereignRegistryService with mocked dependencies, once per class.
 
         Args:
             mock_repo: Mocked sovereign model repository.
@@ -453,21 +836,20 @@ class TestSovereignRegistryService:
             publisher=mock_publisher,
         )
 
-    @pytest.mark.asyncio
     async def test_register_model_creates_record_and_publishes_event(
         self,
         service: SovereignRegistryService,
-        mock_repo: AsyncMock,
+        mock_repo: AsyncStub,
         mock_publisher: AsyncMock,
+        tenant: MagicMock,
     ) -> None:
         """register_model must create a PENDING registration and publish event.
 
         Verifies that registering a model calls the repository with the
         correct arguments and publishes a SovereignModelRegistered event.
         """
-        tenant = _make_tenant()
         sovereign_model = MagicMock(spec=SovereignModel)
-        sovereign_model.id = uuid.uuid4()
+        sovereign_model.id = _fake_uuid()
         sovereign_model.model_id = "llama-3-8b"
         sovereign_model.jurisdiction = "EU"
         sovereign_model.approval_status = ModelApprovalStatus.PENDING
@@ -493,59 +875,47 @@ class TestSovereignRegistryService:
         mock_publisher.publish_sovereign_model_registered.assert_called_once()
         assert result == sovereign_model
 
-    @pytest.mark.asyncio
-    async def test_list_sovereign_models_filters_by_jurisdiction(
+    @pytest.mark.parametrize(
+        ("jurisdiction", "expected_method", "unexpected_method"),
+        [
+            pytest.param("DE", "list_by_jurisdiction", "list_all", id="filtered"),
+            pytest.param(None, "list_all", "list_by_jurisdiction", id="unfiltered"),
+        ],
+    )
+    async def test_list_sovereign_models_selects_repository_query(
         self,
         service: SovereignRegistryService,
-        mock_repo: AsyncMock,
-        mock_publisher: AsyncMock,
+        mock_repo: AsyncStub,
+        jurisdiction: str | None,
+        expected_method: str,
+        unexpected_method: str,
+        tenant: MagicMock,
     ) -> None:
-        """list_sovereign_models with jurisdiction must call list_by_jurisdiction.
+        """list_sovereign_models must filter by jurisdiction only when one is given.
 
-        When jurisdiction is specified, the repository's list_by_jurisdiction
-        method should be called rather than list_all.
+        With a jurisdiction the repository's list_by_jurisdiction is used;
+        without one, list_all returns registrations across all jurisdictions.
         """
-        tenant = _make_tenant()
-        mock_repo.list_by_jurisdiction.return_value = []
+        getattr(mock_repo, expected_method).return_value = []
 
-        await service.list_sovereign_models(jurisdiction="DE", tenant=tenant)
+        await service.list_sovereign_models(jurisdiction=jurisdiction, tenant=tenant)
 
-        mock_repo.list_by_jurisdiction.assert_called_once_with("DE", tenant)
-        mock_repo.list_all.assert_not_called()
+        expected_args = (jurisdiction, tenant) if jurisdiction is not None else (tenant,)
+        getattr(mock_repo, expected_method).assert_called_once_with(*expected_args)
+        getattr(mock_repo, unexpected_method).assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_list_sovereign_models_no_filter_returns_all(
-        self,
-        service: SovereignRegistryService,
-        mock_repo: AsyncMock,
-        mock_publisher: AsyncMock,
-    ) -> None:
-        """list_sovereign_models without jurisdiction must call list_all.
-
-        When no jurisdiction filter is provided, all model registrations
-        across all jurisdictions should be returned.
-        """
-        tenant = _make_tenant()
-        mock_repo.list_all.return_value = []
-
-        await service.list_sovereign_models(jurisdiction=None, tenant=tenant)
-
-        mock_repo.list_all.assert_called_once_with(tenant)
-        mock_repo.list_by_jurisdiction.assert_not_called()
-
-    @pytest.mark.asyncio
     async def test_approve_model_updates_status_and_publishes_event(
         self,
         service: SovereignRegistryService,
-        mock_repo: AsyncMock,
+        mock_repo: AsyncStub,
         mock_publisher: AsyncMock,
+        tenant: MagicMock,
     ) -> None:
         """approve_model must update status to APPROVED and publish event.
 
         Verifies that approving a model calls the repository update method
         and publishes a SovereignModelApproved event.
         """
-        tenant = _make_tenant()
         model_reg_id = uuid.uuid4()
         approved_model = MagicMock(spec=SovereignModel)
         approved_model.id = model_reg_id
@@ -568,3 +938,309 @@ class TestSovereignRegistryService:
         )
         mock_publisher.publish_sovereign_model_approved.assert_called_once()
         assert result == approved_model
+
+
+class TestModelRegistryService:
+    """Tests for ModelRegistryService read caching."""
+
+    pytestmark = pytest.mark.asyncio
+
+    @pytest.fixture
+    def mock_registry(self) -> AsyncMock:
+        """Return a mock sovereign registry adapter."""
+        return AsyncMock()
+
+    @pytest.fixture
+    def mock_publisher(self) -> AsyncMock:
+        """Return the shared event publisher mock, reset for this test."""
+        return _fresh_publisher()
+
+    @pytest.fixture
+    def service(self, mock_registry: AsyncMock, mock_publisher: AsyncMock) -> ModelRegistryService:
+        """Return a ModelRegistryService with a TTL cache attached."""
+        return ModelRegistryService(
+            registry=mock_registry,
+            model_repo=AsyncStub(),
+            publisher=mock_publisher,
+            cache=AsyncTTLCache(maxsize=16, ttl_seconds=60),
+        )
+
+    async def test_query_registry_repeat_read_is_served_from_cache(
+        self,
+        service: ModelRegistryService,
+        mock_registry: AsyncMock,
+        tenant: MagicMock,
+    ) -> None:
+        """A second identical query_registry call must not reach the adapter."""
+        mock_registry.query_registry.return_value = [{"model_id": "llama-3-8b"}]
+
+        first = await service.query_registry(jurisdiction="DE", tenant=tenant)
+        second = await service.query_registry(jurisdiction="DE", tenant=tenant)
+
+        assert first == second == [{"model_id": "llama-3-8b"}]
+        mock_registry.query_registry.assert_called_once()
+
+    async def test_register_and_certify_invalidates_cached_reads(
+        self,
+        service: ModelRegistryService,
+        mock_registry: AsyncMock,
+        tenant: MagicMock,
+    ) -> None:
+        """Registering a model must drop the tenant's cached registry reads."""
+        mock_registry.query_registry.return_value = []
+        mock_registry.register_model.return_value = {"registry_id": str(_fake_uuid())}
+        mock_registry.certify_model.return_value = {}
+
+        await service.query_registry(jurisdiction="DE", tenant=tenant)
+        await service.register_and_certify(
+            model_id="llama-3-8b",
+            model_version="1.0",
+            jurisdiction="DE",
+            compliance_tags=["gdpr"],
+            certification_framework="gdpr",
+            certified_by="compliance-officer@aumos.io",
+            tenant=tenant,
+        )
+        await service.query_registry(jurisdiction="DE", tenant=tenant)
+
+        assert mock_registry.query_registry.call_count == 2
+
+
+class TestKeyManagementService:
+    """Tests for KeyManagementService raw key import."""
+
+    pytestmark = pytest.mark.asyncio
+
+    async def test_import_customer_key_bytes_wipes_buffer_after_import(self, tenant: MagicMock) -> None:
+        """import_customer_key_bytes must zero a bytearray once the import returns."""
+        key_manager = AsyncMock()
+        key_manager.import_key_bytes.return_value = {"key_id": "byok-1", "state": "active"}
+        service = KeyManagementService(
+            key_manager=key_manager,
+            publisher=_fresh_publisher(),
+        )
+        key_material = bytearray(b"\x5a" * 32)
+
+        result = await service.import_customer_key_bytes(
+            key_id="byok-1",
+            algorithm="AES-256",
+            key_material=key_material,
+            jurisdiction="DE",
+            tenant=tenant,
+        )
+
+        key_manager.import_key_bytes.assert_called_once()
+        assert result["state"] == "active"
+        assert key_material == bytearray(32)
+
+    async def test_import_customer_key_bytes_with_real_key_manager(self, tenant: MagicMock) -> None:
+        """SovereignKeyManager must implement import_key_bytes and leave the buffer wiped."""
+        service = KeyManagementService(
+            key_manager=SovereignKeyManager(),
+            publisher=_fresh_publisher(),
+        )
+        key_material = bytearray(b"\x5a" * 32)
+
+        result = await service.import_customer_key_bytes(
+            key_id="byok-1",
+            algorithm="AES-256",
+            key_material=key_material,
+            jurisdiction="DE",
+            tenant=tenant,
+        )
+
+        assert result["key_alias"] == "byok-1"
+        assert result["tenant_id"] == str(_TEST_TENANT_ID)
+        assert len(result["fingerprint"]) == 64
+        assert key_material == bytearray(32)
+
+    @pytest.mark.parametrize(
+        "key_material",
+        [b"\x5a" * 32, memoryview(b"\x5a" * 32), memoryview(bytearray(64))[::2]],
+        ids=["bytes", "readonly-view", "non-contiguous-view"],
+    )
+    async def test_import_customer_key_bytes_rejects_unwipeable_buffers(
+        self,
+        key_material: bytes | memoryview,
+        tenant: MagicMock,
+    ) -> None:
+        """Buffers that cannot be wiped in place must be rejected before the import."""
+        key_manager = AsyncMock()
+        service = KeyManagementService(key_manager=key_manager, publisher=_fresh_publisher())
+
+        with pytest.raises(TypeError):
+            await service.import_customer_key_bytes(
+                key_id="byok-1",
+                algorithm="AES-256",
+                key_material=key_material,
+                jurisdiction="DE",
+                tenant=tenant,
+            )
+
+        key_manager.import_key_bytes.assert_not_called()
+
+
+class TestSovereignEventPublisher:
+    """Tests for SovereignEventPublisher event batching."""
+
+    pytestmark = pytest.mark.asyncio
+
+    async def test_batch_defers_publishing_until_block_exits(
+        self,
+        tenant: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Events published inside batch() must only be sent, and logged, when the block exits."""
+        underlying = AsyncMock()
+        publisher = SovereignEventPublisher(underlying)
+        mock_logger = MagicMock()
+        monkeypatch.setattr("aumos_sovereign_ai.adapters.kafka.logger", mock_logger)
+
+        async with publisher.batch() as events:
+            for region in ("eu-west-1", "eu-central-1"):
+                await events.publish_deployment_initiated(
+                    tenant_id=tenant.tenant_id,
+                    deployment_id=str(_fake_uuid()),
+                    region=region,
+                    jurisdiction="DE",
+                    correlation_id="corr-1",
+                )
+            underlying.publish.assert_not_called()
+            mock_logger.info.assert_not_called()
+
+        assert underlying.publish.call_count == 2
+        logged = [call.args[0] for call in mock_logger.info.call_args_list]
+        assert logged.count("Published DeploymentInitiated event") == 2
+
+    async def test_batch_does_not_log_events_when_flush_fails(
+        self,
+        tenant: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A failed flush must not leave "Published" log lines for undelivered events."""
+        underlying = AsyncMock()
+        underlying.publish.side_effect = ConnectionError("broker unavailable")
+        publisher = SovereignEventPublisher(underlying)
+        mock_logger = MagicMock()
+        monkeypatch.setattr("aumos_sovereign_ai.adapters.kafka.logger", mock_logger)
+
+        async def publish_in_batch() -> None:
+            async with publisher.batch() as events:
+                await events.publish_residency_rule_created(
+                    tenant_id=tenant.tenant_id,
+                    rule_id=str(_fake_uuid()),
+                    jurisdiction="DE",
+                    correlation_id="corr-1",
+                )
+
+        with pytest.raises(ConnectionError):
+            await publish_in_batch()
+
+        mock_logger.info.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("failing", "expected_error"),
+        [({"FR"}, ConnectionError), ({"FR", "IT"}, ExceptionGroup)],
+        ids=["one-failed", "several-failed"],
+    )
+    async def test_batch_logs_delivered_events_when_flush_partly_fails(
+        self,
+        tenant: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        failing: set[str],
+        expected_error: type[Exception],
+    ) -> None:
+        """Events that reached Kafka must still be logged when other sends in the flush fail."""
+
+        async def publish(topic: str, event: dict[str, str]) -> None:
+            if event["jurisdiction"] in failing:
+                raise ConnectionError(f"broker rejected {event['jurisdiction']}")
+
+        underlying = AsyncMock()
+        underlying.publish.side_effect = publish
+        publisher = SovereignEventPublisher(underlying)
+        mock_logger = MagicMock()
+        monkeypatch.setattr("aumos_sovereign_ai.adapters.kafka.logger", mock_logger)
+
+        async def publish_in_batch() -> None:
+            async with publisher.batch() as events:
+                for jurisdiction in ("DE", "FR", "IT"):
+                    await events.publish_residency_rule_created(
+                        tenant_id=tenant.tenant_id,
+                        rule_id=str(_fake_uuid()),
+                        jurisdiction=jurisdiction,
+                        correlation_id="corr-1",
+                    )
+
+        with pytest.raises(expected_error):
+            await publish_in_batch()
+
+        assert underlying.publish.call_count == 3
+        logged = {call.kwargs["jurisdiction"] for call in mock_logger.info.call_args_list}
+        assert logged == {"DE", "FR", "IT"} - failing
+        mock_logger.error.assert_called_once()
+
+    async def test_batch_drops_events_when_block_raises(self, tenant: MagicMock) -> None:
+        """A failing batch block must not emit any buffered events."""
+        underlying = AsyncMock()
+        publisher = SovereignEventPublisher(underlying)
+
+        async def fail_inside_batch() -> None:
+            async with publisher.batch() as events:
+                await events.publish_residency_rule_created(
+                    tenant_id=tenant.tenant_id,
+                    rule_id=str(_fake_uuid()),
+                    jurisdiction="DE",
+                    correlation_id="corr-1",
+                )
+                raise RuntimeError("deployment failed")
+
+        with pytest.raises(RuntimeError, match="deployment failed"):
+            await fail_inside_batch()
+
+        underlying.publish.assert_not_called()
+
+
+class TestRegionalDeployer:
+    """Tests for RegionalDeployer multi-region fan-out."""
+
+    pytestmark = pytest.mark.asyncio
+
+    async def test_deploy_multi_region_reports_each_region_when_one_fails(
+        self,
+        tenant: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """One region's failure must not discard the other regions' results."""
+        deployer = RegionalDeployer()
+        deploy_to_region = deployer.deploy_to_region
+
+        async def flaky_deploy_to_region(**kwargs: object) -> dict[str, object]:
+            if kwargs["region"] == "eu-central-1":
+                raise RuntimeError("cluster API unavailable")
+            return await deploy_to_region(**kwargs)
+
+        monkeypatch.setattr(deployer, "deploy_to_region", flaky_deploy_to_region)
+
+        results = await deployer.deploy_multi_region(
+            model_id="llama-3-8b",
+            model_version="1.0",
+            target_regions=["eu-west-1", "eu-central-1", "mars-1"],
+            jurisdiction_map={"eu-west-1": "DE", "eu-central-1": "DE"},
+            tenant=tenant,
+        )
+
+        assert [r["region"] for r in results] == ["eu-west-1", "eu-central-1", "mars-1"]
+        assert [r["status"] for r in results] == ["deploying", "failed", "skipped"]
+        assert results[1]["error"] == "cluster API unavailable"
+
+
+def test_publisher_template_rejects_unknown_attributes() -> None:
+    """The shared publisher mock must keep enforcing the publisher spec."""
+    publisher = _fresh_publisher()
+
+    assert callable(publisher.publish_residency_violation)
+    with pytest.raises(AttributeError):
+        publisher.publish_unknown_event  # noqa: B018
+    with pytest.raises(AttributeError):
+        publisher.publish_unknown_event = AsyncMock()